@@ -5,12 +5,21 @@ Produces three CSV files used by the tumor_microenvironment.ipynb notebook:
 - tme_cell_metadata.csv      (cell_id, cell_type, subtype, patient_id, tissue_region)
 - tme_marker_metadata.csv    (marker, positivity_cutoff)
 
+plus a tme_data.meta.json sidecar holding a hash of the configuration, which
+generate_if_stale() uses to skip regeneration when nothing has changed.
+When pyarrow is installed, Parquet copies of the three tables are written
+too; load() prefers them over the CSVs (which the notebook still reads).
+
 Models within-type heterogeneity (2-3 subtypes per cell type), marker-aware noise,
 realistic TME cell proportions, and tissue region assignment.
 
 No dream-heatmap dependency — only numpy + pandas.
 """
 
+import hashlib
+import importlib.util
+import json
+
 import numpy as np
 import pandas as pd
 from pathlib import Path
@@ -24,6 +33,18 @@ N_PATIENTS = 20
 TOTAL_CELLS = 5000
 BATCH_STD = 0.05
 
+# Bump whenever the generation code changes in a way the settings below
+# don't capture, so stale cached files get regenerated
+GENERATOR_VERSION = 1
+
+OUTPUT_FILES = (
+    "tme_expression_matrix.csv",
+    "tme_cell_metadata.csv",
+    "tme_marker_metadata.csv",
+)
+PARQUET_FILES = tuple(f.replace(".csv", ".parquet") for f in OUTPUT_FILES)
+META_FILE = "tme_data.meta.json"
+
 MARKERS = [
     "HER2", "CK", "Ki67", "EGFR", "E-cadherin", "p53",
     "CD45", "CD8", "CD4", "FOXP3", "CD20", "CD56",
@@ -54,6 +75,10 @@ for m in _STRUCTURAL:
 for m in _FUNCTIONAL:
     MARKER_NOISE[m] = (0.12, 0.05)
 
+# Per-marker std vectors (same order as MARKERS) for vectorized noise draws
+POS_STD = np.array([MARKER_NOISE[m][0] for m in MARKERS])
+BG_STD = np.array([MARKER_NOISE[m][1] for m in MARKERS])
+
 # ---------------------------------------------------------------------------
 # Cell type proportions (of TOTAL_CELLS)
 # ---------------------------------------------------------------------------
@@ -233,6 +258,13 @@ SUBTYPES = {
     ],
 }
 
+# Convert archetypes to arrays once and precompute each subtype's per-marker
+# noise std (positive_std where archetype > 0.20, else background_std).
+for _type_subtypes in SUBTYPES.values():
+    for _st in _type_subtypes:
+        _st["arch"] = np.asarray(_st["arch"])
+        _st["std"] = np.where(_st["arch"] > 0.20, POS_STD, BG_STD)
+
 # ---------------------------------------------------------------------------
 # Tissue region assignment probabilities per cell type
 # ---------------------------------------------------------------------------
@@ -279,11 +311,22 @@ def _compute_cell_counts(rng):
     return counts
 
 
-def _assign_noise(archetype_val, marker_name, rng, n):
-    """Generate marker-aware noise for n cells."""
-    pos_std, bg_std = MARKER_NOISE[marker_name]
-    std = pos_std if archetype_val > 0.20 else bg_std
-    return rng.normal(0, std, size=n)
+def _config_hash():
+    """Hash the generator version and every setting that affects the generated files."""
+    config = (
+        GENERATOR_VERSION, SEED, N_PATIENTS, TOTAL_CELLS, BATCH_STD,
+        MARKERS, MARKER_NOISE, CELL_TYPE_PROPORTIONS, SUBTYPES, REGION_PROBS, CUTOFFS,
+    )
+    return hashlib.sha256(repr(config).encode()).hexdigest()
+
+
+def _write_expression_csv(path, expr_matrix, cell_ids):
+    """Write the (n_cells, n_markers) matrix as a markers × cells CSV, one savetxt row per marker."""
+    with open(path, "w") as f:
+        f.write("," + ",".join(cell_ids) + "\n")
+        for marker, row in zip(MARKERS, expr_matrix.T):
+            f.write(marker + ",")
+            np.savetxt(f, row[None, :], fmt="%.6f", delimiter=",")
 
 
 def generate():
@@ -291,25 +334,29 @@ def generate():
     out_dir = Path(__file__).parent
 
     # Pre-compute patient batch effects: (n_patients, n_markers)
-    batch_effects = rng.normal(0, BATCH_STD, size=(N_PATIENTS, len(MARKERS)))
+    batch_effects = rng.standard_normal((N_PATIENTS, len(MARKERS))) * BATCH_STD
 
     cell_counts = _compute_cell_counts(rng)
-
-    cell_ids = []
-    cell_types = []
-    subtypes = []
-    patient_ids = []
-    tissue_regions = []
-    match_types = []
-    expression_rows = []  # list of 1-D arrays, one per cell
-
-    cell_counter = 0
-    region_names = ["Tumor core", "Invasive margin", "Stroma"]
+    n_total = sum(cell_counts.values())
+
+    # Preallocated per-cell outputs, filled one subtype block at a time.
+    # (n_cells, n_markers) expression; float32 is plenty for values in [0, 1]
+    expr_matrix = np.empty((n_total, len(MARKERS)), dtype=np.float32)
+    cell_types = np.empty(n_total, dtype=object)
+    subtypes = np.empty(n_total, dtype=object)
+    patient_idx = np.empty(n_total, dtype=np.intp)
+    region_idx = np.empty(n_total, dtype=np.intp)
+    offset = 0
+
+    patient_names = np.array([f"P{p + 1:02d}" for p in range(N_PATIENTS)])
+    region_names = np.array(["Tumor core", "Invasive margin", "Stroma"])
+    region_weights_by_type = {
+        ct: np.array([probs[r] for r in region_names]) for ct, probs in REGION_PROBS.items()
+    }
 
     for cell_type, total_for_type in cell_counts.items():
         type_subtypes = SUBTYPES[cell_type]
-        region_prob = REGION_PROBS[cell_type]
-        region_weights = [region_prob[r] for r in region_names]
+        region_weights = region_weights_by_type[cell_type]
 
         # Distribute cells across subtypes
         subtype_cells_remaining = total_for_type
@@ -320,49 +367,34 @@ def generate():
                 n_subtype = int(round(st["proportion"] * total_for_type))
                 subtype_cells_remaining -= n_subtype
 
-            archetype = np.array(st["arch"])
+            archetype = st["arch"]
 
             # Distribute across patients (roughly even, with remainder spread)
             base_per_patient = n_subtype // N_PATIENTS
             extra = n_subtype % N_PATIENTS
             patient_alloc = [base_per_patient + (1 if p < extra else 0) for p in range(N_PATIENTS)]
+            block = slice(offset, offset + n_subtype)
+            offset += n_subtype
+            patient_idx[block] = np.repeat(np.arange(N_PATIENTS), patient_alloc)
 
-            for patient_idx in range(N_PATIENTS):
-                n_cells = patient_alloc[patient_idx]
-                if n_cells == 0:
-                    continue
-
-                patient_id = f"P{patient_idx + 1:02d}"
-
-                for _ in range(n_cells):
-                    cell_counter += 1
-                    cell_id = f"cell_{cell_counter:04d}"
-
-                    # Per-marker noise
-                    noise = np.array([
-                        _assign_noise(archetype[mi], MARKERS[mi], rng, 1)[0]
-                        for mi in range(len(MARKERS))
-                    ])
-
-                    expr = archetype + batch_effects[patient_idx] + noise
-                    expr = np.clip(expr, 0.0, 1.0)
+            # Whole subtype block at once: noise + archetype + batch effect,
+            # accumulated in place and clipped straight into the output buffer
+            expr = rng.standard_normal((n_subtype, len(MARKERS)))
+            expr *= st["std"]
+            expr += archetype
+            expr += batch_effects[patient_idx[block]]
+            np.clip(expr, 0.0, 1.0, out=expr_matrix[block])
 
-                    # Tissue region assignment
-                    region = rng.choice(region_names, p=region_weights)
+            # Tissue region assignment
+            region_idx[block] = rng.choice(len(region_names), size=n_subtype, p=region_weights)
 
-                    match_type = rng.choice(["perfect", "soft"])
+            cell_types[block] = cell_type
+            subtypes[block] = st["name"]
 
-                    cell_ids.append(cell_id)
-                    cell_types.append(cell_type)
-                    subtypes.append(st["name"])
-                    patient_ids.append(patient_id)
-                    tissue_regions.append(region)
-                    match_types.append(match_type)
-                    expression_rows.append(expr)
-
-    # Build expression matrix: markers × cells
-    expr_matrix = np.column_stack(expression_rows)  # (n_markers, n_cells)
-    expression_df = pd.DataFrame(expr_matrix, index=MARKERS, columns=cell_ids)
+    cell_ids = ("cell_" + pd.Series(np.arange(1, n_total + 1)).astype(str).str.zfill(4)).tolist()
+    patient_ids = patient_names[patient_idx]
+    tissue_regions = region_names[region_idx]
+    match_types = np.where(rng.integers(0, 2, size=n_total), "perfect", "soft")
 
     # Cell metadata
     cell_meta_df = pd.DataFrame({
@@ -402,11 +434,29 @@ def generate():
     })
 
     # Write CSVs
-    expression_df.to_csv(out_dir / "tme_expression_matrix.csv")
-    cell_meta_df.to_csv(out_dir / "tme_cell_metadata.csv", index=False)
-    marker_meta_df.to_csv(out_dir / "tme_marker_metadata.csv", index=False)
-
-    print(f"Expression matrix: {expression_df.shape[0]} markers x {expression_df.shape[1]} cells")
+    expr_file, cell_file, marker_file = OUTPUT_FILES
+    _write_expression_csv(out_dir / expr_file, expr_matrix, cell_ids)
+    cell_meta_df.to_csv(out_dir / cell_file, index=False)
+    marker_meta_df.to_csv(out_dir / marker_file, index=False)
+
+    # Parquet copies for fast loading. The expression matrix is stored as
+    # cells × markers: a Parquet schema with one column per cell is slow.
+    # It is read back from the CSV so both copies hold the same (6-decimal,
+    # float64) values, whichever one load() picks.
+    expr_pq, cell_pq, marker_pq = PARQUET_FILES
+    if _has_pyarrow():
+        pd.read_csv(out_dir / expr_file, index_col=0).T.to_parquet(out_dir / expr_pq)
+        cell_meta_df.to_parquet(out_dir / cell_pq, index=False)
+        marker_meta_df.to_parquet(out_dir / marker_pq, index=False)
+    else:
+        # Don't leave Parquet files from an earlier run shadowing the new CSVs
+        for f in PARQUET_FILES:
+            (out_dir / f).unlink(missing_ok=True)
+
+    (out_dir / META_FILE).write_text(json.dumps({"hash": _config_hash()}))
+
+    n_cells, n_markers = expr_matrix.shape
+    print(f"Expression matrix: {n_markers} markers x {n_cells} cells")
     print(f"Cell metadata:     {len(cell_meta_df)} rows")
     print(f"  Cell types:      {cell_meta_df['cell_type'].value_counts().to_dict()}")
     print(f"  Subtypes:        {cell_meta_df['subtype'].nunique()} unique")
@@ -415,5 +465,51 @@ def generate():
     print(f"Files written to:  {out_dir}")
 
 
+def generate_if_stale():
+    """Run generate() unless the files on disk match the current configuration.
+
+    Returns True if the data was regenerated.
+    """
+    out_dir = Path(__file__).parent
+    meta_path = out_dir / META_FILE
+    if meta_path.exists() and all((out_dir / f).exists() for f in OUTPUT_FILES):
+        try:
+            if json.loads(meta_path.read_text()).get("hash") == _config_hash():
+                return False
+        except ValueError:
+            pass
+    generate()
+    return True
+
+
+def _has_pyarrow():
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def _read_csv(path, **kwargs):
+    """pd.read_csv using the multithreaded pyarrow parser when it is installed."""
+    if _has_pyarrow():
+        kwargs["engine"] = "pyarrow"
+    return pd.read_csv(path, **kwargs)
+
+
+def load():
+    """Read the generated files: (expression, cell metadata, marker metadata)."""
+    out_dir = Path(__file__).parent
+    expr_pq, cell_pq, marker_pq = PARQUET_FILES
+    if all((out_dir / f).exists() for f in PARQUET_FILES):
+        expr = pd.read_parquet(out_dir / expr_pq).T
+        col_meta = pd.read_parquet(out_dir / cell_pq).set_index("cell_id")
+        row_meta = pd.read_parquet(out_dir / marker_pq).set_index("marker")
+        return expr, col_meta, row_meta
+
+    expr_file, cell_file, marker_file = OUTPUT_FILES
+    # The C parser beats pyarrow's CSV reader on the 20 x n_cells wide matrix
+    expr = pd.read_csv(out_dir / expr_file, index_col=0)
+    col_meta = _read_csv(out_dir / cell_file).set_index("cell_id")
+    row_meta = _read_csv(out_dir / marker_file).set_index("marker")
+    return expr, col_meta, row_meta
+
+
 if __name__ == "__main__":
     generate()
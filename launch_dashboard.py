@@ -1,11 +1,11 @@
 """Launch the dream-heatmap dashboard with TME expression data."""
+import sys
+sys.path.insert(0, "data")
 
-import pandas as pd
+import generate_tme_data as gen
 import dream_heatmap as dh
 
-expr = pd.read_csv("data/tme_expression_matrix.csv", index_col=0)
-col_meta = pd.read_csv("data/tme_cell_metadata.csv").set_index("cell_id")
-row_meta = pd.read_csv("data/tme_marker_metadata.csv").set_index("marker")
+expr, col_meta, row_meta = gen.load()
 
 # # print(f"Expression matrix: {expr.shape[0]} markers x {expr.shape[1]} cells")
 # print(f"Col metadata columns: {list(col_meta.columns)}")
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import functools
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Callable
 
 import numpy as np
+import pandas as pd
 
 
 # Valid edges for annotation placement
@@ -16,6 +18,40 @@ DEFAULT_TRACK_WIDTH = 15.0  # pixels for categorical/minigraph tracks
 DEFAULT_TRACK_GAP = 3.0     # gap between adjacent tracks
 
 
+def cache_render_data(
+    method: Callable[[Any, np.ndarray], dict],
+) -> Callable[[Any, np.ndarray], dict]:
+    """Memoize get_render_data for the most recently seen visual_order array.
+
+    Keyed on the identity of the array (held by reference, so the key
+    cannot be recycled). IDMapper never mutates its visual_order, so
+    re-rendering the same mapper returns the cached dict, which callers
+    must treat as read-only.
+    """
+    @functools.wraps(method)
+    def wrapper(self: Any, visual_order: np.ndarray) -> dict:
+        cached = getattr(self, "_render_cache", None)
+        if cached is not None and cached[0] is visual_order:
+            return cached[1]
+        data = method(self, visual_order)
+        self._render_cache = (visual_order, data)
+        return data
+
+    return wrapper
+
+
+def drop_duplicate_ids(data: pd.Series | pd.DataFrame) -> pd.Series | pd.DataFrame:
+    """Keep only the first entry for each ID.
+
+    Tracks look IDs up with Index.get_indexer, which needs a unique index.
+    Checking is_unique also builds the index's hash table up front, so the
+    first render doesn't pay for it.
+    """
+    if data.index.is_unique:
+        return data
+    return data[~data.index.duplicated()]
+
+
 class AnnotationTrack(ABC):
     """Base class for annotation tracks placed alongside the heatmap.
 
@@ -30,6 +66,8 @@ class AnnotationTrack(ABC):
     ) -> None:
         self._name = name
         self._track_width = track_width
+        # Most recent (visual_order, positions) pair from _lookup_positions
+        self._last_lookup: tuple[np.ndarray, np.ndarray] | None = None
 
     @property
     def name(self) -> str:
@@ -39,6 +77,20 @@ class AnnotationTrack(ABC):
     def track_width(self) -> float:
         return self._track_width
 
+    def _lookup_positions(self, index: pd.Index, visual_order: np.ndarray) -> np.ndarray:
+        """Return each visual_order ID's position in index, or -1 if missing.
+
+        The last lookup is reused while visual_order is the same array
+        object (IDMapper never mutates it). The result must be treated as
+        read-only.
+        """
+        last = self._last_lookup
+        if last is not None and last[0] is visual_order:
+            return last[1]
+        positions = index.get_indexer(visual_order)
+        self._last_lookup = (visual_order, positions)
+        return positions
+
     @abstractmethod
     def get_render_data(self, visual_order: np.ndarray) -> dict:
         """Return serializable render data for JS.
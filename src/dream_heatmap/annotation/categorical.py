@@ -7,7 +7,12 @@ from typing import Any
 import numpy as np
 import pandas as pd
 
-from .base import AnnotationTrack, DEFAULT_TRACK_WIDTH
+from ..core.metadata import str_values
+from .base import (
+    AnnotationTrack,
+    DEFAULT_TRACK_WIDTH,
+    drop_duplicate_ids,
+)
 
 
 # Default color palette for categories (RColorBrewer Set2, 8 colors)
@@ -36,8 +41,17 @@ class CategoricalAnnotation(AnnotationTrack):
     ) -> None:
         super().__init__(name=name, track_width=track_width)
         self._show_labels = show_labels
-        self._values = values.copy()
-        self._categories = list(dict.fromkeys(str(v) for v in values))
+        values = drop_duplicate_ids(values)
+        # Only the (immutable) index and the stringified values are kept, so
+        # no defensive copy of the Series is needed
+        self._index = values.index
+        # str() of each value, positionally aligned with self._index (same
+        # strings as MetadataFrame.get_categories, so splits and tracks agree)
+        self._labels = str_values(values)
+        # Categories in order of first appearance, plus each value's code
+        codes, uniques = pd.factorize(self._labels)
+        self._categories = uniques.tolist()
+        self._codes = codes
 
         if colors is not None:
             self._colors = colors
@@ -47,6 +61,14 @@ class CategoricalAnnotation(AnnotationTrack):
                 for i, cat in enumerate(self._categories)
             }
 
+        # Render lookups that don't depend on visual order
+        self._color_lut = np.array(
+            [self._colors.get(cat, "#cccccc") for cat in self._categories] + ["#cccccc"],
+            dtype=object,
+        )
+        self._color_map = {cat: self._colors[cat] for cat in self._categories}
+        self._colors_key = frozenset(self._colors.items())
+
     @property
     def annotation_type(self) -> str:
         return "categorical"
@@ -59,18 +81,23 @@ class CategoricalAnnotation(AnnotationTrack):
     def colors(self) -> dict[str, str]:
         return dict(self._colors)
 
+    @property
+    def colors_key(self) -> frozenset:
+        """Hashable form of the color mapping (for legend deduplication)."""
+        return self._colors_key
+
     def get_render_data(self, visual_order: np.ndarray) -> dict:
         """Return per-cell color data in visual order."""
-        cell_colors = []
-        cell_labels = []
-        for item_id in visual_order:
-            if item_id in self._values.index:
-                cat = str(self._values[item_id])
-                cell_colors.append(self._colors.get(cat, "#cccccc"))
-                cell_labels.append(cat)
-            else:
-                cell_colors.append("#cccccc")
-                cell_labels.append("")
+        positions = self._lookup_positions(self._index, visual_order)
+        found = positions >= 0
+        labels = np.full(len(positions), "", dtype=object)
+        labels[found] = self._labels[positions[found]]
+
+        # Category codes; -1 (IDs without a value) picks the trailing grey
+        codes = np.full(len(positions), -1, dtype=np.intp)
+        codes[found] = self._codes[positions[found]]
+        cell_colors = self._color_lut[codes].tolist()
+        cell_labels = labels.tolist()
 
         return {
             "type": "categorical",
@@ -78,7 +105,7 @@ class CategoricalAnnotation(AnnotationTrack):
             "trackWidth": self._track_width,
             "cellColors": cell_colors,
             "cellLabels": cell_labels,
-            "colorMap": {cat: self._colors[cat] for cat in self._categories},
-            "legend": {cat: self._colors[cat] for cat in self._categories},
+            "colorMap": self._color_map,
+            "legend": self._color_map,
             "showLabels": self._show_labels,
         }
@@ -5,7 +5,8 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 
-from .base import AnnotationTrack
+from ..core.metadata import str_values
+from .base import AnnotationTrack, drop_duplicate_ids
 
 
 class LabelAnnotation(AnnotationTrack):
@@ -28,7 +29,13 @@ class LabelAnnotation(AnnotationTrack):
         track_width: float = 60.0,
     ) -> None:
         super().__init__(name=name, track_width=track_width)
-        self._values = values.copy() if values is not None else None
+        if values is not None:
+            values = drop_duplicate_ids(values)
+        # Only the (immutable) index and the stringified values are kept, so
+        # no defensive copy of the Series is needed
+        self._index = values.index if values is not None else None
+        # str() of each value, positionally aligned with self._index
+        self._labels = str_values(values) if values is not None else None
         self._font_size = font_size
 
     @property
@@ -37,17 +44,17 @@ class LabelAnnotation(AnnotationTrack):
 
     def get_render_data(self, visual_order: np.ndarray) -> dict:
         """Return label text in visual order."""
-        labels = []
-        for item_id in visual_order:
-            if self._values is not None and item_id in self._values.index:
-                labels.append(str(self._values[item_id]))
-            else:
-                labels.append(str(item_id))
+        # IDs themselves are the fallback text for items without a value
+        labels = str_values(np.asarray(visual_order, dtype=object))
+        if self._index is not None:
+            positions = self._lookup_positions(self._index, visual_order)
+            found = positions >= 0
+            labels[found] = self._labels[positions[found]]
 
         return {
             "type": "label",
             "name": self._name,
             "trackWidth": self._track_width,
-            "labels": labels,
+            "labels": labels.tolist(),
             "fontSize": self._font_size,
         }
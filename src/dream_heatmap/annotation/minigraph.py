@@ -1,14 +1,134 @@
-"""Mini-graph annotations: bar, sparkline, box, violin plots."""
+"""Mini-graph annotations: bar, sparkline, box, violin plots.
+
+Tracks reference the data they are given rather than copying it, so it
+should not be modified in place after the track is constructed.
+"""
 
 from __future__ import annotations
 
+import base64
+
 import numpy as np
 import pandas as pd
 
-from .base import AnnotationTrack, DEFAULT_TRACK_WIDTH
+from .base import (
+    AnnotationTrack,
+    DEFAULT_TRACK_WIDTH,
+    cache_render_data,
+    drop_duplicate_ids,
+)
+
+
+def _finite_range(values: np.ndarray) -> tuple[float, float]:
+    """Return (min, max) of the finite values, or (0.0, 1.0) if there are none."""
+    # Masked reductions: no filtered copy of the values is materialized
+    finite = np.isfinite(values)
+    if not finite.any():
+        return (0.0, 1.0)
+    return (
+        float(np.min(values, where=finite, initial=np.inf)),
+        float(np.max(values, where=finite, initial=-np.inf)),
+    )
+
+
+# Per-row numeric payloads can be sent as base64 float32 buffers ("binary")
+# or as nested JSON lists ("list")
+PAYLOAD_FORMATS = ("binary", "list")
+
+
+def _check_payload_format(payload_format: str) -> None:
+    if payload_format not in PAYLOAD_FORMATS:
+        raise ValueError(
+            f"payload_format must be one of {PAYLOAD_FORMATS}, got '{payload_format}'"
+        )
+
 
+def _encode_float32(matrix: np.ndarray) -> str:
+    """Encode a 2D array as base64 little-endian float32 bytes (row-major)."""
+    return base64.b64encode(
+        np.ascontiguousarray(matrix, dtype="<f4").tobytes()
+    ).decode("ascii")
 
-class BarChartAnnotation(AnnotationTrack):
+
+# Box plot quantiles: min, q1, median, q3, max
+_BOX_QUANTILES = np.array([0.0, 0.25, 0.5, 0.75, 1.0])
+
+
+def _box_quantiles(rows: np.ndarray) -> np.ndarray:
+    """Per-row box stats ignoring NaN: np.min, np.percentile(25), np.median,
+    np.percentile(75) and np.max of each row's non-NaN values.
+
+    rows must have at least one non-NaN value each. Returns (n_rows, 5).
+    """
+    n_valid = (~np.isnan(rows)).sum(axis=1)
+    virtual = (n_valid - 1)[:, None] * _BOX_QUANTILES
+    lo = np.floor(virtual).astype(np.intp)
+    hi = np.minimum(lo + 1, (n_valid - 1)[:, None])
+    if (n_valid == rows.shape[1]).all():
+        # Same order statistics for every row: partial sort is enough
+        kth = np.unique(np.concatenate([lo[0], hi[0]]))
+        ordered = np.partition(rows, kth, axis=1)
+    else:
+        # NaNs sort last, so each row's valid values come first
+        ordered = np.sort(rows, axis=1)
+    below = np.take_along_axis(ordered, lo, axis=1)
+    above = np.take_along_axis(ordered, hi, axis=1)
+
+    # Quartiles interpolate the way np.percentile (linear) does; exact order
+    # statistics (t == 0) are taken as is, so infinities don't become NaN
+    t = virtual - lo
+    result = below.copy()
+    between = t > 0
+    with np.errstate(invalid="ignore"):
+        diff = above - below
+        lerp = below + diff * t
+        np.subtract(above, diff * (1 - t), out=lerp, where=t >= 0.5)
+        result[between] = lerp[between]
+        # np.median averages the two middle values of an even count
+        even = between[:, 2]
+        result[even, 2] = (below[even, 2] + above[even, 2]) / 2
+    # Extremes are the first and last valid values
+    result[:, 0] = ordered[:, 0]
+    result[:, 4] = ordered[np.arange(len(rows)), n_valid - 1]
+    return result
+
+
+class _NumericTrack(AnnotationTrack):
+    """Shared setup and ID resolution for the numeric mini-graph tracks."""
+
+    def __init__(
+        self,
+        name: str,
+        data: pd.Series | pd.DataFrame,
+        color: str,
+        track_width: float,
+    ) -> None:
+        super().__init__(name=name, track_width=track_width)
+        data = drop_duplicate_ids(data)
+        self._index = data.index
+        self._values_np = data.to_numpy(dtype=np.float64)
+        self._color = color
+        self._vmin, self._vmax = _finite_range(self._values_np)
+
+    def _resolve(self, visual_order: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return (visual indices of IDs with data, their rows in the values)."""
+        positions = self._lookup_positions(self._index, visual_order)
+        present = np.flatnonzero(positions >= 0)
+        return present, positions[present]
+
+    def _render_header(self) -> dict:
+        """Render data keys common to every numeric track."""
+        return {
+            "type": self.annotation_type,
+            "name": self._name,
+            "trackWidth": self._track_width,
+            "color": self._color,
+            "vmin": self._vmin,
+            "vmax": self._vmax,
+        }
+
+
+class BarChartAnnotation(_NumericTrack):
     """Bar chart showing a numeric value per row/column.
 
     Usage::
@@ -26,44 +146,41 @@ class BarChartAnnotation(AnnotationTrack):
         vmin: float | None = None,
         vmax: float | None = None,
     ) -> None:
-        super().__init__(name=name, track_width=track_width)
-        self._values = values.copy()
-        self._color = color
-        finite = values[np.isfinite(values)]
-        self._vmin = vmin if vmin is not None else (float(finite.min()) if len(finite) > 0 else 0.0)
-        self._vmax = vmax if vmax is not None else (float(finite.max()) if len(finite) > 0 else 1.0)
+        super().__init__(name, values, color, track_width)
+        # Bar heights with non-finite values drawn as 0, resolved once here
+        self._heights = np.where(np.isfinite(self._values_np), self._values_np, 0.0)
+        if vmin is not None:
+            self._vmin = vmin
+        if vmax is not None:
+            self._vmax = vmax
 
     @property
     def annotation_type(self) -> str:
         return "bar"
 
+    @cache_render_data
     def get_render_data(self, visual_order: np.ndarray) -> dict:
-        bar_values = []
-        for item_id in visual_order:
-            if item_id in self._values.index:
-                v = float(self._values[item_id])
-                bar_values.append(v if np.isfinite(v) else 0.0)
-            else:
-                bar_values.append(0.0)
+        # Missing IDs draw as 0
+        present, rows = self._resolve(visual_order)
+        heights = np.zeros(len(visual_order))
+        heights[present] = self._heights[rows]
 
-        return {
-            "type": "bar",
-            "name": self._name,
-            "trackWidth": self._track_width,
-            "values": bar_values,
-            "color": self._color,
-            "vmin": self._vmin,
-            "vmax": self._vmax,
-        }
+        data = self._render_header()
+        data["values"] = heights
+        return data
 
 
-class SparklineAnnotation(AnnotationTrack):
+class SparklineAnnotation(_NumericTrack):
     """Sparkline showing a series of values per row/column.
 
     Each row/col gets a small line chart. The data is a DataFrame
     where each row corresponds to one heatmap row/col ID and columns
     are the sparkline points.
 
+    By default the series are sent as one base64 float32 buffer
+    (NaN marks gaps and missing IDs); payload_format="list" sends
+    nested lists instead.
+
     Usage::
 
         ann = SparklineAnnotation("trend", trend_df)
@@ -76,41 +193,43 @@ class SparklineAnnotation(AnnotationTrack):
         data: pd.DataFrame,
         color: str = "#4e79a7",
         track_width: float = 50.0,
+        payload_format: str = "binary",
     ) -> None:
-        super().__init__(name=name, track_width=track_width)
-        self._data = data.copy()
-        self._color = color
+        _check_payload_format(payload_format)
+        super().__init__(name, data, color, track_width)
+        self._payload_format = payload_format
 
     @property
     def annotation_type(self) -> str:
         return "sparkline"
 
+    @cache_render_data
     def get_render_data(self, visual_order: np.ndarray) -> dict:
-        all_values = self._data.values
-        finite = all_values[np.isfinite(all_values)]
-        vmin = float(finite.min()) if len(finite) > 0 else 0.0
-        vmax = float(finite.max()) if len(finite) > 0 else 1.0
-
-        series_list = []
-        for item_id in visual_order:
-            if item_id in self._data.index:
-                row = self._data.loc[item_id].values.tolist()
-                series_list.append([v if np.isfinite(v) else None for v in row])
-            else:
-                series_list.append([])
-
-        return {
-            "type": "sparkline",
-            "name": self._name,
-            "trackWidth": self._track_width,
-            "series": series_list,
-            "color": self._color,
-            "vmin": vmin,
-            "vmax": vmax,
-        }
-
-
-class BoxPlotAnnotation(AnnotationTrack):
+        present, rows = self._resolve(visual_order)
+        data = self._render_header()
+
+        if self._payload_format == "binary":
+            series = np.full((len(visual_order), self._values_np.shape[1]), np.nan)
+            series[present] = self._values_np[rows]
+            series[~np.isfinite(series)] = np.nan
+            data["seriesB64"] = _encode_float32(series)
+            data["seriesShape"] = list(series.shape)
+            return data
+
+        # Non-finite points become gaps (None), set in one masked assignment
+        values = self._values_np[rows]
+        points = values.astype(object)
+        points[~np.isfinite(values)] = None
+
+        # Missing IDs get an empty series
+        series_list: list[list] = [[] for _ in range(len(visual_order))]
+        for i, row in zip(present.tolist(), points.tolist()):
+            series_list[i] = row
+        data["series"] = series_list
+        return data
+
+
+class BoxPlotAnnotation(_NumericTrack):
     """Box plot showing distribution per row/column.
 
     Each row/col gets a mini box plot. Provide a DataFrame where
@@ -129,53 +248,40 @@ class BoxPlotAnnotation(AnnotationTrack):
         color: str = "#4e79a7",
         track_width: float = 40.0,
     ) -> None:
-        super().__init__(name=name, track_width=track_width)
-        self._data = data.copy()
-        self._color = color
+        super().__init__(name, data, color, track_width)
 
     @property
     def annotation_type(self) -> str:
         return "boxplot"
 
+    @cache_render_data
     def get_render_data(self, visual_order: np.ndarray) -> dict:
-        all_values = self._data.values
-        finite = all_values[np.isfinite(all_values)]
-        vmin = float(finite.min()) if len(finite) > 0 else 0.0
-        vmax = float(finite.max()) if len(finite) > 0 else 1.0
-
-        stats_list = []
-        for item_id in visual_order:
-            if item_id in self._data.index:
-                row = self._data.loc[item_id].dropna().values
-                if len(row) > 0:
-                    stats_list.append({
-                        "min": float(np.min(row)),
-                        "q1": float(np.percentile(row, 25)),
-                        "median": float(np.median(row)),
-                        "q3": float(np.percentile(row, 75)),
-                        "max": float(np.max(row)),
-                    })
-                else:
-                    stats_list.append(None)
-            else:
-                stats_list.append(None)
+        stats_list: list[dict | None] = [None] * len(visual_order)
 
-        return {
-            "type": "boxplot",
-            "name": self._name,
-            "trackWidth": self._track_width,
-            "stats": stats_list,
-            "color": self._color,
-            "vmin": vmin,
-            "vmax": vmax,
-        }
+        # Rows that exist and have at least one non-NaN value get a box
+        present, rows = self._resolve(visual_order)
+        rows = self._values_np[rows]
+        has_box = ~np.isnan(rows).all(axis=1)
+        if has_box.any():
+            quantiles = _box_quantiles(rows[has_box])
+            for i, (q0, q1, q2, q3, q4) in zip(present[has_box].tolist(), quantiles.tolist()):
+                stats_list[i] = {"min": q0, "q1": q1, "median": q2, "q3": q3, "max": q4}
+
+        data = self._render_header()
+        data["stats"] = stats_list
+        return data
 
 
-class ViolinPlotAnnotation(AnnotationTrack):
+class ViolinPlotAnnotation(_NumericTrack):
     """Violin plot showing distribution per row/column.
 
     Similar to BoxPlot but rendered as a density shape.
 
+    The bin centers are shared by all rows and sent once. By default the
+    normalized counts are sent as one base64 float32 buffer (NaN rows
+    mark IDs without a density); payload_format="list" sends per-row
+    dicts instead.
+
     Usage::
 
         ann = ViolinPlotAnnotation("density", replicate_df)
@@ -189,47 +295,64 @@ class ViolinPlotAnnotation(AnnotationTrack):
         color: str = "#4e79a7",
         track_width: float = 40.0,
         n_bins: int = 20,
+        payload_format: str = "binary",
     ) -> None:
-        super().__init__(name=name, track_width=track_width)
-        self._data = data.copy()
-        self._color = color
+        _check_payload_format(payload_format)
+        super().__init__(name, data, color, track_width)
+        self._payload_format = payload_format
         self._n_bins = n_bins
 
+        # Same bins as np.histogram(row, bins=n_bins, range=(vmin, vmax)),
+        # fixed for the track's lifetime
+        vmin, vmax = self._vmin, self._vmax
+        self._first, self._last = (vmin - 0.5, vmax + 0.5) if vmin == vmax else (vmin, vmax)
+        self._edges = np.linspace(self._first, self._last, n_bins + 1)
+        self._centers = ((self._edges[:-1] + self._edges[1:]) / 2).tolist()
+
     @property
     def annotation_type(self) -> str:
         return "violin"
 
+    @cache_render_data
     def get_render_data(self, visual_order: np.ndarray) -> dict:
-        all_values = self._data.values
-        finite = all_values[np.isfinite(all_values)]
-        vmin = float(finite.min()) if len(finite) > 0 else 0.0
-        vmax = float(finite.max()) if len(finite) > 0 else 1.0
-
-        density_list = []
-        for item_id in visual_order:
-            if item_id in self._data.index:
-                row = self._data.loc[item_id].dropna().values
-                if len(row) >= 2:
-                    counts, edges = np.histogram(row, bins=self._n_bins, range=(vmin, vmax))
-                    # Normalize to [0, 1]
-                    max_count = counts.max()
-                    if max_count > 0:
-                        normed = (counts / max_count).tolist()
-                    else:
-                        normed = [0.0] * self._n_bins
-                    centers = ((edges[:-1] + edges[1:]) / 2).tolist()
-                    density_list.append({"counts": normed, "centers": centers})
-                else:
-                    density_list.append(None)
-            else:
-                density_list.append(None)
-
-        return {
-            "type": "violin",
-            "name": self._name,
-            "trackWidth": self._track_width,
-            "densities": density_list,
-            "color": self._color,
-            "vmin": vmin,
-            "vmax": vmax,
-        }
+        n_bins = self._n_bins
+        first, last, edges = self._first, self._last, self._edges
+
+        # Rows that exist and have at least two non-NaN values get a density
+        present, rows = self._resolve(visual_order)
+        rows = self._values_np[rows]
+        valid = ~np.isnan(rows)
+        has_density = valid.sum(axis=1) >= 2
+        rows, valid = rows[has_density], valid[has_density]
+
+        normed = np.zeros((len(rows), n_bins))
+        if len(rows) > 0:
+            # Half-open bins except the last, out-of-range values dropped
+            bins = np.searchsorted(edges, rows, side="right") - 1
+            bins[rows == last] = n_bins - 1
+            in_range = valid & (rows >= first) & (rows <= last)
+
+            # One bincount over (row, bin) pairs for all rows at once
+            flat_bins = (np.arange(len(rows))[:, None] * n_bins + bins)[in_range]
+            counts = np.bincount(flat_bins, minlength=len(rows) * n_bins).reshape(len(rows), n_bins)
+
+            # Normalize each row to [0, 1]
+            max_counts = counts.max(axis=1, keepdims=True)
+            np.divide(counts, max_counts, out=normed, where=max_counts > 0)
+
+        # Bin centers are shared by every row, so they are sent once
+        data = self._render_header()
+        data["centers"] = self._centers
+
+        if self._payload_format == "binary":
+            densities = np.full((len(visual_order), n_bins), np.nan)
+            densities[present[has_density]] = normed
+            data["densitiesB64"] = _encode_float32(densities)
+            data["densitiesShape"] = list(densities.shape)
+            return data
+
+        density_list: list[dict | None] = [None] * len(visual_order)
+        for i, row_counts in zip(present[has_density].tolist(), normed):
+            density_list[i] = {"counts": row_counts}
+        data["densities"] = density_list
+        return data
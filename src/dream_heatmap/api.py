@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Any
+import importlib
 import math
 
 import numpy as np
@@ -24,6 +26,66 @@ from .annotation.categorical import CategoricalAnnotation
 from .widget.selection import SelectionState
 
 
+# Display/export classes imported on first use: they pull in heavy
+# dependencies (and concat imports this module back)
+_LAZY_IMPORTS = {
+    "HeatmapWidget": ".widget.heatmap_widget",
+    "HTMLExporter": ".export.html_export",
+    "HeatmapList": ".concat.heatmap_list",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a lazily loaded name once and cache it in the module globals."""
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __package__), name)
+    globals()[name] = value
+    return value
+
+
+def _lazy(name: str) -> Any:
+    """Return a lazily loaded module global (see __getattr__)."""
+    # Global lookups inside functions bypass module __getattr__
+    try:
+        return globals()[name]
+    except KeyError:
+        return __getattr__(name)
+
+
+# LayoutComposer.compute keyword argument for each edge's annotation extent
+_EXTENT_ARGS = {
+    "left": "left_annotation_width",
+    "right": "right_annotation_width",
+    "top": "top_annotation_height",
+    "bottom": "bottom_annotation_height",
+}
+
+# Approximate width of one label character at the 10px label/legend font
+_CHAR_WIDTH = 6.5
+# Column labels are drawn rotated by 45 degrees
+_SIN_45 = math.sin(math.radians(45))
+
+# Split groups are clustered on two threads only when their submatrices hold
+# at least this many cells in total; below it thread start-up costs more
+_PARALLEL_CLUSTER_MIN_CELLS = 1_000_000
+
+
+def _memo_matches(memo: tuple | None, settings: tuple, objects: tuple) -> bool:
+    """True if a (settings, objects, value) memo was built from these inputs.
+
+    settings are compared by equality; objects (arrays, layouts) by identity,
+    which is enough because they are never mutated once built.
+    """
+    return (
+        memo is not None
+        and memo[0] == settings
+        and len(memo[1]) == len(objects)
+        and all(a is b for a, b in zip(memo[1], objects))
+    )
+
+
 class Heatmap:
     """Interactive heatmap builder.
 
@@ -44,6 +106,22 @@ class Heatmap:
     PRIMARY_GAP_PX = 8.0
     SECONDARY_GAP_PX = 3.0
 
+    # Every attribute set in __init__ (add new ones here too)
+    __slots__ = (
+        "_matrix", "_row_metadata", "_col_metadata", "_color_scale",
+        "_row_mapper", "_col_mapper",
+        "_row_cluster", "_col_cluster", "_row_dendro_specs", "_col_dendro_specs",
+        "_annotations", "_annotation_extents",
+        "_row_label_mode", "_col_label_mode", "_row_label_side", "_col_label_side",
+        "_show_row_dendro", "_show_col_dendro", "_row_dendro_side", "_col_dendro_side",
+        "_layout_composer", "_layout", "_selection",
+        "_color_bar_title", "_title", "_value_description",
+        "_row_gap_sizes", "_col_gap_sizes",
+        "_widget", "_last_zoom_key", "_base_panels",
+        "_legend_dims_cache",
+        "_annotation_data_memo", "_label_data_memo", "_legend_data_memo",
+    )
+
     def __init__(self, data: pd.DataFrame) -> None:
         self._matrix = MatrixData(data)
         self._row_metadata: MetadataFrame | None = None
@@ -67,6 +145,11 @@ class Heatmap:
         self._annotations: dict[str, list[AnnotationTrack]] = {
             "left": [], "right": [], "top": [], "bottom": [],
         }
+        # Per-edge annotation extents as LayoutComposer.compute keyword
+        # arguments, kept in step by add_annotation
+        self._annotation_extents: dict[str, float] = dict.fromkeys(
+            _EXTENT_ARGS.values(), 0.0
+        )
 
         # Label display mode
         self._row_label_mode: str = "auto"
@@ -104,20 +187,33 @@ class Heatmap:
 
         # Widget reference (created on show())
         self._widget = None
+        # Memo of the zoom range the widget currently shows (range key None =
+        # full view), keyed on the view state it was rendered from
+        self._last_zoom_key: tuple | None = None
+        # Memo of the full (unzoomed) view, (settings, objects, (layout,
+        # dendrograms, annotations, labels)) (see _full_view)
+        self._base_panels: tuple | None = None
+
+        # Layout estimate memos, keyed on their inputs (see _estimate_*)
+        self._legend_dims_cache: tuple[tuple, tuple[float, float]] | None = None
+        # Panel data memos, (settings, objects, value) (see _memo_matches)
+        self._annotation_data_memo: tuple | None = None
+        self._label_data_memo: tuple | None = None
+        self._legend_data_memo: tuple | None = None
 
     # --- Metadata ---
 
     def set_row_metadata(self, df: pd.DataFrame) -> Heatmap:
         """Set row metadata. Index must match matrix row IDs exactly."""
         self._row_metadata = MetadataFrame(
-            df, pd.Index(self._matrix.row_ids), axis_name="row"
+            df, self._matrix.row_index, axis_name="row"
         )
         return self
 
     def set_col_metadata(self, df: pd.DataFrame) -> Heatmap:
         """Set column metadata. Index must match matrix column IDs exactly."""
         self._col_metadata = MetadataFrame(
-            df, pd.Index(self._matrix.col_ids), axis_name="col"
+            df, self._matrix.col_index, axis_name="col"
         )
         return self
 
@@ -148,6 +244,7 @@ class Heatmap:
             vmax=vmax if vmax is not None else data_vmax,
         )
         self._color_bar_title = color_bar_title
+        self._invalidate_view()
         return self
 
     # --- Title ---
@@ -161,6 +258,7 @@ class Heatmap:
             Title text. Pass empty string to remove.
         """
         self._title = title if title else None
+        self._invalidate_view()
         return self
 
     # --- Value description ---
@@ -177,6 +275,7 @@ class Heatmap:
             Value description (e.g. "Expression (TPM)").
         """
         self._value_description = description if description else None
+        self._invalidate_view()
         return self
 
     # --- Splits ---
@@ -208,6 +307,7 @@ class Heatmap:
         self._row_mapper = self._row_mapper.apply_splits(split_assignments)
         if isinstance(by, list) and len(by) >= 2:
             self._row_gap_sizes = self._compute_gap_sizes(self._row_mapper)
+        self._invalidate_view()
         return self
 
     def split_cols(
@@ -237,6 +337,7 @@ class Heatmap:
         self._col_mapper = self._col_mapper.apply_splits(split_assignments)
         if isinstance(by, list) and len(by) >= 2:
             self._col_gap_sizes = self._compute_gap_sizes(self._col_mapper)
+        self._invalidate_view()
         return self
 
     # --- Clustering ---
@@ -259,6 +360,7 @@ class Heatmap:
             metric=metric,
             optimal_ordering=optimal_ordering,
         )
+        self._invalidate_view()
         return self
 
     def cluster_cols(
@@ -279,6 +381,7 @@ class Heatmap:
             metric=metric,
             optimal_ordering=optimal_ordering,
         )
+        self._invalidate_view()
         return self
 
     # --- Reorder ---
@@ -317,6 +420,7 @@ class Heatmap:
         self._row_mapper = self._row_mapper.apply_reorder_within_groups(
             group_orders
         )
+        self._invalidate_view()
         return self
 
     def order_cols(
@@ -353,6 +457,7 @@ class Heatmap:
         self._col_mapper = self._col_mapper.apply_reorder_within_groups(
             group_orders
         )
+        self._invalidate_view()
         return self
 
     # --- Annotations ---
@@ -383,6 +488,10 @@ class Heatmap:
                 f"'{edge}' already has {len(self._annotations[edge])}."
             )
         self._annotations[edge].append(annotation)
+        self._annotation_extents[_EXTENT_ARGS[edge]] = AnnotationLayoutEngine.total_edge_width(
+            self._annotations[edge]
+        )
+        self._invalidate_view()
         return self
 
     # --- Size ---
@@ -408,6 +517,7 @@ class Heatmap:
             self._layout_composer._max_width = max_width
         if max_height is not None:
             self._layout_composer._max_height = max_height
+        self._invalidate_view()
         return self
 
     # --- Labels ---
@@ -447,6 +557,7 @@ class Heatmap:
             if col_side not in ("top", "bottom"):
                 raise ValueError(f"col_side must be 'top' or 'bottom', got '{col_side}'")
             self._col_label_side = col_side
+        self._invalidate_view()
         return self
 
     # --- Dendrogram placement ---
@@ -473,6 +584,7 @@ class Heatmap:
             if col_side not in ("top", "bottom"):
                 raise ValueError(f"col_side must be 'top' or 'bottom', got '{col_side}'")
             self._col_dendro_side = col_side
+        self._invalidate_view()
         return self
 
     # --- Concatenation ---
@@ -483,8 +595,7 @@ class Heatmap:
 
         Returns a HeatmapList that can be shown or queried.
         """
-        from .concat.heatmap_list import HeatmapList
-        return HeatmapList(list(heatmaps), direction="horizontal")
+        return _lazy("HeatmapList")(list(heatmaps), direction="horizontal")
 
     @classmethod
     def vconcat(cls, *heatmaps: Heatmap) -> Any:
@@ -492,8 +603,7 @@ class Heatmap:
 
         Returns a HeatmapList that can be shown or queried.
         """
-        from .concat.heatmap_list import HeatmapList
-        return HeatmapList(list(heatmaps), direction="vertical")
+        return _lazy("HeatmapList")(list(heatmaps), direction="vertical")
 
     # --- Display ---
 
@@ -501,13 +611,8 @@ class Heatmap:
         """Render the heatmap in Jupyter. Returns the widget."""
         self._compute_layout()
 
-        from .widget.heatmap_widget import HeatmapWidget
-
         # Build extra config data
-        dendro_data = self._build_dendrogram_data()
-        annotation_data = self._build_annotation_data()
-        label_data = self._build_label_data()
-        legend_data = self._build_legend_data()
+        dendro_data, annotation_data, label_data, legend_data = self._build_panels()
 
         # Determine color bar title/subtitle
         # If user set a value_description, it becomes the main title
@@ -515,7 +620,7 @@ class Heatmap:
         cb_title = self._value_description or self._color_bar_title
         cb_subtitle = self._color_bar_title if self._value_description else None
 
-        self._widget = HeatmapWidget(
+        self._widget = _lazy("HeatmapWidget")(
             matrix=self._matrix,
             color_scale=self._color_scale,
             row_mapper=self._row_mapper,
@@ -531,6 +636,11 @@ class Heatmap:
             title=self._title,
         )
         self._widget.set_zoom_callback(self._handle_zoom)
+        self._last_zoom_key = self._zoom_memo(None)
+        self._base_panels = (
+            self._view_settings(), self._view_objects(),
+            (self._layout, dendro_data, annotation_data, label_data),
+        )
         return self._widget
 
     def to_html(self, path: str, title: str = "dream-heatmap") -> None:
@@ -544,12 +654,12 @@ class Heatmap:
             HTML page title.
         """
         self._compute_layout()
-        from .export.html_export import HTMLExporter
+        dendro_data, annotation_data, label_data, legend_data = self._build_panels()
 
         cb_title = self._value_description or self._color_bar_title
         cb_subtitle = self._color_bar_title if self._value_description else None
 
-        HTMLExporter.export(
+        _lazy("HTMLExporter").export(
             path=path,
             matrix=self._matrix,
             color_scale=self._color_scale,
@@ -557,10 +667,10 @@ class Heatmap:
             col_mapper=self._col_mapper,
             layout=self._layout,
             title=title,
-            dendrograms=self._build_dendrogram_data(),
-            annotations=self._build_annotation_data(),
-            labels=self._build_label_data(),
-            legends=self._build_legend_data(),
+            dendrograms=dendro_data,
+            annotations=annotation_data,
+            labels=label_data,
+            legends=legend_data,
             color_bar_title=cb_title,
             color_bar_subtitle=cb_subtitle,
             heatmap_title=self._title,
@@ -599,90 +709,85 @@ class Heatmap:
         if self._widget is None:
             return
 
+        # Repeated events for the range already shown (e.g. while dragging)
+        # need no work
         if zoom_range is None:
-            # Reset: use original mappers and full matrix
+            key = None
+        elif "row_ids" in zoom_range:
+            key = ("ids", tuple(zoom_range["row_ids"]), tuple(zoom_range["col_ids"]))
+        else:
+            key = tuple(sorted(zoom_range.items()))
+        zoom_memo = self._zoom_memo(key)
+        if _memo_matches(self._last_zoom_key, zoom_memo[0], zoom_memo[1]):
+            return
+
+        if zoom_range is None:
+            # Reset: back to the full view of the current state
             zoomed_row = self._row_mapper
             zoomed_col = self._col_mapper
             zoomed_matrix = self._matrix
-        elif "row_ids" in zoom_range:
-            # ID-based zoom (annotation click): filter to specific IDs
-            zoomed_row = self._row_mapper.apply_zoom_by_ids(zoom_range["row_ids"])
-            zoomed_col = self._col_mapper.apply_zoom_by_ids(zoom_range["col_ids"])
-            zoomed_matrix = self._matrix.slice(
-                zoomed_row.visual_order, zoomed_col.visual_order,
-            )
+            (zoomed_layout, zoomed_dendrograms,
+             zoomed_annotations, zoomed_labels) = self._full_view()
         else:
-            zoomed_row = self._row_mapper.apply_zoom(
-                zoom_range["row_start"], zoom_range["row_end"]
-            )
-            zoomed_col = self._col_mapper.apply_zoom(
-                zoom_range["col_start"], zoom_range["col_end"]
-            )
+            if "row_ids" in zoom_range:
+                # ID-based zoom (annotation click): filter to specific IDs;
+                # no gap remapping needed
+                zoomed_row = self._row_mapper.apply_zoom_by_ids(zoom_range["row_ids"])
+                zoomed_col = self._col_mapper.apply_zoom_by_ids(zoom_range["col_ids"])
+                zoomed_row_gap_sizes = None
+                zoomed_col_gap_sizes = None
+            else:
+                zoomed_row = self._row_mapper.apply_zoom(
+                    zoom_range["row_start"], zoom_range["row_end"]
+                )
+                zoomed_col = self._col_mapper.apply_zoom(
+                    zoom_range["col_start"], zoom_range["col_end"]
+                )
+                # Remap gap sizes for zoomed coordinate space
+                zoomed_row_gap_sizes = Heatmap._remap_gap_sizes(
+                    self._row_gap_sizes,
+                    zoom_range["row_start"], zoom_range["row_end"],
+                )
+                zoomed_col_gap_sizes = Heatmap._remap_gap_sizes(
+                    self._col_gap_sizes,
+                    zoom_range["col_start"], zoom_range["col_end"],
+                )
             zoomed_matrix = self._matrix.slice(
                 zoomed_row.visual_order, zoomed_col.visual_order,
             )
 
-        # Remap gap sizes for zoomed coordinate space
-        if zoom_range is not None and "row_ids" not in zoom_range:
-            zoomed_row_gap_sizes = Heatmap._remap_gap_sizes(
-                self._row_gap_sizes,
-                zoom_range["row_start"], zoom_range["row_end"],
+            # Recompute layout for zoomed view (legends persist during zoom)
+            legend_w, legend_h = self._estimate_legend_dimensions()
+            left_lbl_w, right_lbl_w, top_lbl_h, bottom_lbl_h = self._estimate_label_space(zoomed_row, zoomed_col)
+            zoomed_layout = self._layout_composer.compute(
+                zoomed_row,
+                zoomed_col,
+                has_row_dendro=(self._row_cluster is not None and self._show_row_dendro),
+                has_col_dendro=(self._col_cluster is not None and self._show_col_dendro),
+                **self._annotation_extents,
+                legend_panel_width=legend_w,
+                legend_panel_height=legend_h,
+                left_label_width=left_lbl_w,
+                right_label_width=right_lbl_w,
+                top_label_height=top_lbl_h,
+                bottom_label_height=bottom_lbl_h,
+                row_gap_sizes=zoomed_row_gap_sizes,
+                col_gap_sizes=zoomed_col_gap_sizes,
+                title_height=28.0 if self._title else 0.0,
+                row_dendro_side=self._row_dendro_side,
+                col_dendro_side=self._col_dendro_side,
             )
-            zoomed_col_gap_sizes = Heatmap._remap_gap_sizes(
-                self._col_gap_sizes,
-                zoom_range["col_start"], zoom_range["col_end"],
-            )
-        elif zoom_range is not None:
-            # ID-based zoom: no gap remapping needed
-            zoomed_row_gap_sizes = None
-            zoomed_col_gap_sizes = None
-        else:
-            zoomed_row_gap_sizes = self._row_gap_sizes
-            zoomed_col_gap_sizes = self._col_gap_sizes
-
-        # Recompute layout for zoomed view (legends persist during zoom)
-        legend_w, legend_h = self._estimate_legend_dimensions()
-        left_lbl_w, right_lbl_w, top_lbl_h, bottom_lbl_h = self._estimate_label_space(zoomed_row, zoomed_col)
-        zoomed_layout = self._layout_composer.compute(
-            zoomed_row,
-            zoomed_col,
-            has_row_dendro=(self._row_cluster is not None and self._show_row_dendro),
-            has_col_dendro=(self._col_cluster is not None and self._show_col_dendro),
-            left_annotation_width=AnnotationLayoutEngine.total_edge_width(
-                self._annotations["left"]
-            ),
-            right_annotation_width=AnnotationLayoutEngine.total_edge_width(
-                self._annotations["right"]
-            ),
-            top_annotation_height=AnnotationLayoutEngine.total_edge_width(
-                self._annotations["top"]
-            ),
-            bottom_annotation_height=AnnotationLayoutEngine.total_edge_width(
-                self._annotations["bottom"]
-            ),
-            legend_panel_width=legend_w,
-            legend_panel_height=legend_h,
-            left_label_width=left_lbl_w,
-            right_label_width=right_lbl_w,
-            top_label_height=top_lbl_h,
-            bottom_label_height=bottom_lbl_h,
-            row_gap_sizes=zoomed_row_gap_sizes,
-            col_gap_sizes=zoomed_col_gap_sizes,
-            title_height=28.0 if self._title else 0.0,
-            row_dendro_side=self._row_dendro_side,
-            col_dendro_side=self._col_dendro_side,
-        )
 
-        # Rebuild annotations and labels for zoomed mappers
-        zoomed_annotations = self._build_annotation_data(
-            row_mapper=zoomed_row, col_mapper=zoomed_col,
-        )
-        zoomed_labels = self._build_label_data(
-            row_mapper=zoomed_row, col_mapper=zoomed_col,
-            layout=zoomed_layout,
-        )
-        # Dendrograms are not meaningful after zoom — omit them
-        zoomed_dendrograms = None if zoom_range is not None else self._build_dendrogram_data()
+            # Rebuild annotations and labels for zoomed mappers
+            zoomed_annotations = self._build_annotation_data(
+                row_mapper=zoomed_row, col_mapper=zoomed_col,
+            )
+            zoomed_labels = self._build_label_data(
+                row_mapper=zoomed_row, col_mapper=zoomed_col,
+                layout=zoomed_layout,
+            )
+            # Dendrograms are not meaningful after zoom — omit them
+            zoomed_dendrograms = None
 
         cb_title = self._value_description or self._color_bar_title
         cb_subtitle = self._color_bar_title if self._value_description else None
@@ -701,9 +806,48 @@ class Heatmap:
             color_bar_subtitle=cb_subtitle,
             title=self._title,
         )
+        self._last_zoom_key = zoom_memo
 
     # --- Internal ---
 
+    def _invalidate_view(self) -> None:
+        """Forget the full view cached by show() and the zoom range shown;
+        called by every mutator."""
+        self._base_panels = None
+        self._last_zoom_key = None
+
+    def _view_settings(self) -> tuple:
+        """View state that callers such as the dashboard set directly,
+        bypassing the mutators (compared by equality)."""
+        return (
+            self._show_row_dendro, self._show_col_dendro,
+            self._row_gap_sizes, self._col_gap_sizes,
+        )
+
+    def _view_objects(self) -> tuple:
+        """The objects the full view is built from (compared by identity)."""
+        return (self._row_mapper, self._col_mapper, self._matrix)
+
+    def _zoom_memo(self, key: tuple | None) -> tuple:
+        """(settings, objects, None) memo for zoom range key in the current state."""
+        return ((key, *self._view_settings()), self._view_objects(), None)
+
+    def _full_view(self) -> tuple[LayoutSpec, dict | None, dict | None, dict | None]:
+        """Return (layout, dendrograms, annotations, labels) of the full view.
+
+        What show() rendered is reused while it was built from the current
+        mappers, matrix and view settings and no mutator has run since;
+        otherwise the view is rebuilt from current state.
+        """
+        settings, objects = self._view_settings(), self._view_objects()
+        if _memo_matches(self._base_panels, settings, objects):
+            return self._base_panels[2]
+        self._compute_layout()
+        dendro_data, annotation_data, label_data, _ = self._build_panels()
+        view = (self._layout, dendro_data, annotation_data, label_data)
+        self._base_panels = (settings, objects, view)
+        return view
+
     def _compute_gap_sizes(self, mapper: IDMapper) -> dict[int, float] | None:
         """Build {gap_position: gap_px} for hierarchical (2-level) splits.
 
@@ -711,20 +855,22 @@ class Heatmap:
         get wider gaps; secondary boundaries get narrower gaps.
         """
         groups = mapper.groups
-        if not groups:
+        # Only "val1|val2" names carry a primary level; flat splits keep the
+        # uniform default gap
+        if not any("|" in g.name for g in groups):
             return None
-        gap_sizes: dict[int, float] = {}
-        running = 0
-        prev_primary = None
-        for group in groups:
-            if running > 0:
-                current_primary = group.name.split("|")[0]
-                if current_primary != prev_primary:
-                    gap_sizes[running] = self.PRIMARY_GAP_PX
-                else:
-                    gap_sizes[running] = self.SECONDARY_GAP_PX
-            prev_primary = group.name.split("|")[0]
-            running += len(group.ids)
+        primaries = np.char.partition(np.array([g.name for g in groups]), "|")[:, 0]
+        sizes = np.fromiter((len(g) for g in groups), dtype=np.int64, count=len(groups))
+        # Boundary before each group after the first; empty leading groups
+        # give no gap, and later groups overwrite earlier ones at a position
+        boundaries = np.cumsum(sizes)[:-1]
+        gap_px = np.where(
+            primaries[1:] != primaries[:-1],
+            self.PRIMARY_GAP_PX,
+            self.SECONDARY_GAP_PX,
+        )
+        keep = boundaries > 0
+        gap_sizes = dict(zip(boundaries[keep].tolist(), gap_px[keep].tolist()))
         return gap_sizes if gap_sizes else None
 
     def _resolve_split(
@@ -736,26 +882,26 @@ class Heatmap:
         axis_name: str,
     ) -> dict[str, list]:
         """Resolve split arguments into a validated assignments dict."""
-        if by is not None and assignments is not None:
-            raise ValueError(
-                "Provide either 'by' or 'assignments', not both."
-            )
-        if by is None and assignments is None:
-            raise ValueError(
-                "Provide either 'by' (metadata column) or 'assignments' "
-                "(explicit {group: [ids]} dict)."
-            )
+        # Metadata split (the common case) first
         if by is not None:
+            if assignments is not None:
+                raise ValueError(
+                    "Provide either 'by' or 'assignments', not both."
+                )
             if metadata is None:
                 raise ValueError(
                     f"Cannot split {axis_name}s by metadata column — "
                     f"call set_{axis_name}_metadata() first."
                 )
             return SplitEngine.split(metadata, by)
-        else:
+        if assignments is not None:
             return SplitEngine.split_by_assignments(
                 assignments, mapper.original_ids
             )
+        raise ValueError(
+            "Provide either 'by' (metadata column) or 'assignments' "
+            "(explicit {group: [ids]} dict)."
+        )
 
     def _do_cluster(
         self,
@@ -767,44 +913,55 @@ class Heatmap:
     ) -> tuple[dict[str, ClusterResult], IDMapper]:
         """Cluster within each group of the mapper. Returns cluster results and updated mapper."""
         matrix_values = self._matrix.values
-        row_ids = self._matrix.row_ids
-        col_ids = self._matrix.col_ids
+        # One hash index for the whole axis, shared by every group's lookup
+        axis_index = self._matrix.row_index if axis == "row" else self._matrix.col_index
 
-        cluster_results: dict[str, ClusterResult] = {}
-        group_orders: dict[str, np.ndarray] = {}
+        groups = mapper.groups
+        results: dict[str, ClusterResult] = {}
+        jobs: list[tuple[str, np.ndarray, np.ndarray]] = []
 
-        for group in mapper.groups:
+        for group in groups:
             group_ids = group.ids
             if len(group_ids) < 2:
                 # Single-item group — no clustering
-                cluster_results[group.name] = ClusterResult(
-                    leaf_order=group_ids.copy(),
-                    linkage_matrix=np.empty((0, 4)),
-                    dendrogram_nodes=(),
-                    ids=group_ids.copy(),
-                )
+                results[group.name] = ClusterResult.unclustered(group_ids)
                 continue
 
             # Extract submatrix for this group
+            indices = axis_index.get_indexer(group_ids)
+            if (indices < 0).any():
+                missing = group_ids[indices < 0][:5].tolist()
+                raise KeyError(f"{axis.capitalize()} IDs not found in matrix: {missing}")
             if axis == "row":
-                # Find row indices for the group IDs
-                id_to_idx = {rid: i for i, rid in enumerate(row_ids)}
-                indices = [id_to_idx[gid] for gid in group_ids]
                 sub_matrix = matrix_values[indices, :]
             else:
-                id_to_idx = {cid: i for i, cid in enumerate(col_ids)}
-                indices = [id_to_idx[gid] for gid in group_ids]
                 sub_matrix = matrix_values[:, indices].T  # cluster by column = transpose
+            jobs.append((group.name, sub_matrix, group_ids))
 
-            result = ClusterEngine.cluster(
+        def run(job: tuple[str, np.ndarray, np.ndarray]) -> ClusterResult:
+            _, sub_matrix, group_ids = job
+            return ClusterEngine.cluster(
                 data=sub_matrix,
                 ids=group_ids,
                 method=method,
                 metric=metric,
                 optimal_ordering=optimal_ordering,
             )
-            cluster_results[group.name] = result
-            group_orders[group.name] = result.leaf_order
+
+        # Groups are independent and SciPy's distance/linkage loops release
+        # the GIL, so large split groups are clustered two at a time
+        total_cells = sum(sub_matrix.size for _, sub_matrix, _ in jobs)
+        if len(jobs) > 1 and total_cells >= _PARALLEL_CLUSTER_MIN_CELLS:
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                clustered = list(pool.map(run, jobs))
+        else:
+            clustered = [run(job) for job in jobs]
+        for (name, _, _), result in zip(jobs, clustered):
+            results[name] = result
+
+        # Keep results in group order
+        cluster_results = {group.name: results[group.name] for group in groups}
+        group_orders = {name: result.leaf_order for (name, _, _), result in zip(jobs, clustered)}
 
         updated_mapper = mapper.apply_reorder_within_groups(group_orders)
         return cluster_results, updated_mapper
@@ -818,18 +975,7 @@ class Heatmap:
             self._col_mapper,
             has_row_dendro=(self._row_cluster is not None and self._show_row_dendro),
             has_col_dendro=(self._col_cluster is not None and self._show_col_dendro),
-            left_annotation_width=AnnotationLayoutEngine.total_edge_width(
-                self._annotations["left"]
-            ),
-            right_annotation_width=AnnotationLayoutEngine.total_edge_width(
-                self._annotations["right"]
-            ),
-            top_annotation_height=AnnotationLayoutEngine.total_edge_width(
-                self._annotations["top"]
-            ),
-            bottom_annotation_height=AnnotationLayoutEngine.total_edge_width(
-                self._annotations["bottom"]
-            ),
+            **self._annotation_extents,
             legend_panel_width=legend_w,
             legend_panel_height=legend_h,
             left_label_width=left_lbl_w,
@@ -843,6 +989,15 @@ class Heatmap:
             col_dendro_side=self._col_dendro_side,
         )
 
+    def _build_panels(self) -> tuple[dict | None, dict | None, dict | None, list[dict] | None]:
+        """Build (dendrograms, annotations, labels, legends) for the current layout."""
+        return (
+            self._build_dendrogram_data(),
+            self._build_annotation_data(),
+            self._build_label_data(),
+            self._build_legend_data(),
+        )
+
     def _build_dendrogram_data(self) -> dict | None:
         """Build dendrogram spec dicts for JS rendering."""
         if self._row_cluster is None and self._col_cluster is None:
@@ -859,7 +1014,7 @@ class Heatmap:
                 # Merge all group dendrograms into one spec
                 all_links = []
                 for spec in row_specs:
-                    all_links.extend(link.to_dict() for link in spec.links)
+                    all_links.extend(spec.link_dicts())
                 result["row"] = {
                     "links": all_links,
                     "side": self._row_dendro_side,
@@ -875,7 +1030,7 @@ class Heatmap:
             if col_specs:
                 all_links = []
                 for spec in col_specs:
-                    all_links.extend(link.to_dict() for link in spec.links)
+                    all_links.extend(spec.link_dicts())
                 result["col"] = {
                     "links": all_links,
                     "side": self._col_dendro_side,
@@ -894,8 +1049,7 @@ class Heatmap:
     ) -> list[DendrogramSpec]:
         """Build DendrogramSpecs for all groups on one axis."""
         specs = []
-        offset = 0
-        for group in mapper.groups:
+        for group, offset in zip(mapper.groups, mapper.group_offsets.tolist()):
             if group.name in cluster_results:
                 cr = cluster_results[group.name]
                 if cr.dendrogram_nodes:
@@ -908,7 +1062,6 @@ class Heatmap:
                     )
                     if spec is not None:
                         specs.append(spec)
-            offset += len(group)
         return specs
 
     def _build_annotation_data(
@@ -917,41 +1070,30 @@ class Heatmap:
         col_mapper: IDMapper | None = None,
     ) -> dict | None:
         """Build annotation data dicts for JS rendering."""
-        has_any = any(
-            tracks for tracks in self._annotations.values()
-        )
-        if not has_any:
+        if not any(self._annotations.values()):
             return None
 
         rm = row_mapper or self._row_mapper
         cm = col_mapper or self._col_mapper
 
-        result: dict = {}
-        edge_mapper = {
-            "left": rm,
-            "right": rm,
-            "top": cm,
-            "bottom": cm,
-        }
+        # Reused while the tracks and both visual orders are unchanged
+        settings = (self._all_tracks(),)
+        objects = (rm.visual_order, cm.visual_order)
+        if _memo_matches(self._annotation_data_memo, settings, objects):
+            return self._annotation_data_memo[2]
 
-        for edge, tracks in self._annotations.items():
+        result: dict = {}
+        for edge, mapper in (("left", rm), ("right", rm), ("top", cm), ("bottom", cm)):
+            tracks = self._annotations[edge]
             if not tracks:
                 continue
-            mapper = edge_mapper[edge]
             specs = AnnotationLayoutEngine.compute_edge_tracks(
                 tracks, edge, mapper.visual_order,
             )
-            result[edge] = [
-                {
-                    "name": spec.name,
-                    "edge": spec.edge,
-                    "offset": spec.offset,
-                    "trackWidth": spec.track_width,
-                    "renderData": spec.render_data,
-                }
-                for spec in specs
-            ]
-        return result if result else None
+            result[edge] = [spec.to_dict() for spec in specs]
+        data = result if result else None
+        self._annotation_data_memo = (settings, objects, data)
+        return data
 
     def _build_label_data(
         self,
@@ -967,41 +1109,56 @@ class Heatmap:
         rm = row_mapper or self._row_mapper
         cm = col_mapper or self._col_mapper
 
+        settings = (
+            self._row_label_mode, self._col_label_mode,
+            self._row_label_side, self._col_label_side,
+        )
+        objects = (rm.visual_order, cm.visual_order, lay)
+        if _memo_matches(self._label_data_memo, settings, objects):
+            return self._label_data_memo[2]
+
         result: dict = {}
         font_size = 10.0  # Default font size
 
         if self._row_label_mode != "none":
-            row_labels = LabelLayoutEngine.compute(
-                ids=rm.visual_order,
-                cell_layout=lay.row_cell_layout,
-                mode=self._row_label_mode,
-                font_size=font_size,
-            )
             result["row"] = {
-                "labels": LabelLayoutEngine.serialize(row_labels, font_size=font_size),
+                "labels": LabelLayoutEngine.compute_serialized(
+                    ids=rm.visual_order,
+                    cell_layout=lay.row_cell_layout,
+                    mode=self._row_label_mode,
+                    font_size=font_size,
+                    texts=rm.id_strings,
+                ),
                 "side": self._row_label_side,
             }
 
         if self._col_label_mode != "none":
-            col_labels = LabelLayoutEngine.compute(
-                ids=cm.visual_order,
-                cell_layout=lay.col_cell_layout,
-                mode=self._col_label_mode,
-                font_size=font_size,
-            )
             result["col"] = {
-                "labels": LabelLayoutEngine.serialize(col_labels, font_size=font_size),
+                "labels": LabelLayoutEngine.compute_serialized(
+                    ids=cm.visual_order,
+                    cell_layout=lay.col_cell_layout,
+                    mode=self._col_label_mode,
+                    font_size=font_size,
+                    texts=cm.id_strings,
+                ),
                 "side": self._col_label_side,
             }
 
-        return result if result else None
+        data = result if result else None
+        self._label_data_memo = (settings, objects, data)
+        return data
 
     def _build_legend_data(self) -> list[dict] | None:
         """Collect categorical annotation legends from all edges.
 
-        Deduplicates by (name, frozenset(colorMap.items())).
+        Deduplicates by (name, colors_key).
         Returns a list of {name, entries: [{label, color}]} or None.
+        Legends persist across zooms, so this is memoized on the tracks.
         """
+        settings = (self._all_tracks(),)
+        if _memo_matches(self._legend_data_memo, settings, ()):
+            return self._legend_data_memo[2]
+
         seen: set[tuple] = set()
         legends: list[dict] = []
 
@@ -1009,11 +1166,11 @@ class Heatmap:
             for track in reversed(self._annotations[edge]):
                 if not isinstance(track, CategoricalAnnotation):
                     continue
-                color_map = track.colors
-                key = (track.name, frozenset(color_map.items()))
+                key = (track.name, track.colors_key)
                 if key in seen:
                     continue
                 seen.add(key)
+                color_map = track.colors
                 legends.append({
                     "name": track.name,
                     "entries": [
@@ -1022,7 +1179,13 @@ class Heatmap:
                     ],
                 })
 
-        return legends if legends else None
+        data = legends if legends else None
+        self._legend_data_memo = (settings, (), data)
+        return data
+
+    def _all_tracks(self) -> tuple[AnnotationTrack, ...]:
+        """All annotation tracks, edge by edge (a memo key for panel data)."""
+        return tuple(track for tracks in self._annotations.values() for track in tracks)
 
     def _estimate_label_space(
         self,
@@ -1034,19 +1197,16 @@ class Heatmap:
         Returns (left_label_w, right_label_w, top_label_h, bottom_label_h).
         Only the relevant side gets non-zero size based on label side setting.
         """
-        char_width = 6.5
         rm = row_mapper or self._row_mapper
         cm = col_mapper or self._col_mapper
 
         row_label_width = 0.0
         if self._row_label_mode != "none" and rm.size > 0:
-            max_len = max(len(str(rid)) for rid in rm.visual_order)
-            row_label_width = max_len * char_width + 10
+            row_label_width = rm.max_label_length * _CHAR_WIDTH + 10
 
         col_label_height = 0.0
         if self._col_label_mode != "none" and cm.size > 0:
-            max_len = max(len(str(cid)) for cid in cm.visual_order)
-            col_label_height = max_len * char_width * math.sin(math.radians(45)) + 10
+            col_label_height = cm.max_label_length * _CHAR_WIDTH * _SIN_45 + 10
 
         left_label_w = row_label_width if self._row_label_side == "left" else 0.0
         right_label_w = row_label_width if self._row_label_side == "right" else 0.0
@@ -1059,12 +1219,25 @@ class Heatmap:
         """Estimate the pixel width and height needed for the legend panel.
 
         Uses vertical stacking: color bar on top, categorical legends stacked
-        below. Returns (width, height).
+        below. Returns (width, height). The result only depends on the color
+        bar titles and the annotation tracks, so it is memoized on those.
         """
+        key = (
+            self._value_description,
+            self._color_bar_title,
+            self._all_tracks(),
+        )
+        if self._legend_dims_cache is not None and self._legend_dims_cache[0] == key:
+            return self._legend_dims_cache[1]
+        dims = self._compute_legend_dimensions()
+        self._legend_dims_cache = (key, dims)
+        return dims
+
+    def _compute_legend_dimensions(self) -> tuple[float, float]:
+        """Uncached body of _estimate_legend_dimensions."""
         # Constants matching legend_renderer.js
         swatch_size = 11.0
         swatch_label_gap = 7.0
-        char_width = 6.5  # approximate at 10px font
         row_height = 16.0
         title_height = 18.0
         block_gap = 20.0  # vertical gap between stacked blocks
@@ -1081,16 +1254,18 @@ class Heatmap:
         if has_cb_subtitle:
             color_bar_height += 14.0
 
-        # Build list of (width, height) blocks
-        blocks: list[tuple[float, float]] = []
-        blocks.append((color_bar_width, color_bar_height))
+        # Vertical stack of blocks, color bar first: width is the widest
+        # block, height is all blocks stacked
+        total_width = color_bar_width
+        total_height = color_bar_height
+        n_blocks = 1
 
         legends = self._build_legend_data()
         if legends:
             for legend in legends:
                 entries = legend["entries"]
                 n = len(entries)
-                title_w = len(legend["name"]) * char_width
+                title_w = len(legend["name"]) * _CHAR_WIDTH
 
                 # Compute column layout (matches legend_renderer.js thresholds)
                 if n <= 4:
@@ -1110,7 +1285,7 @@ class Heatmap:
                 max_label_len = max(
                     (len(e["label"]) for e in entries), default=0,
                 )
-                col_content_w = swatch_size + swatch_label_gap + max_label_len * char_width
+                col_content_w = swatch_size + swatch_label_gap + max_label_len * _CHAR_WIDTH
                 if num_cols == 1:
                     block_w = max(title_w, col_content_w) + 10.0
                 else:
@@ -1118,10 +1293,11 @@ class Heatmap:
                     block_w = min(col_content_w * 2 + column_gap_px + 10.0, MAX_LEGEND_WIDTH)
 
                 block_h = title_height + rows_per_col * row_height + (14.0 if truncated else 0.0)
-                blocks.append((block_w, block_h))
+                total_width = max(total_width, block_w)
+                total_height += block_h
+                n_blocks += 1
 
-        # Vertical stack: width is the widest block, height is all blocks stacked
-        total_width = min(max(bw for bw, bh in blocks), MAX_LEGEND_WIDTH)
-        total_height = sum(bh for bw, bh in blocks) + block_gap * (len(blocks) - 1)
+        total_width = min(total_width, MAX_LEGEND_WIDTH)
+        total_height += block_gap * (n_blocks - 1)
 
         return total_width, total_height
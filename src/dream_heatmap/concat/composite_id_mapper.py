@@ -60,6 +60,9 @@ class CompositeIDMapper:
             offset += mapper.size
 
         self._total_size = offset
+        # Panel bounds, ascending, for binary search in resolve_range
+        self._starts = np.array([p.start for p in self._panels], dtype=np.int64)
+        self._ends = np.array([p.end for p in self._panels], dtype=np.int64)
 
     @property
     def direction(self) -> str:
@@ -81,10 +84,13 @@ class CompositeIDMapper:
         start = max(0, start)
         end = min(self._total_size, end)
         result: dict[int, list] = {}
+        if start >= end:
+            return result
 
-        for panel in self._panels:
-            if panel.end <= start or panel.start >= end:
-                continue
+        # Only panels ending after start and starting before end overlap
+        first = int(np.searchsorted(self._ends, start, side="right"))
+        last = int(np.searchsorted(self._starts, end, side="left"))
+        for panel in self._panels[first:last]:
             # Overlap region
             local_start = max(0, start - panel.start)
             local_end = min(panel.mapper.size, end - panel.start)
@@ -47,37 +47,45 @@ class CompositeLayoutComposer:
         panel_layouts: list[LayoutSpec],
     ) -> CompositeLayoutSpec:
         """Arrange panels left-to-right."""
-        if not panel_layouts:
-            raise ValueError("At least one panel layout required.")
-
-        total_height = max(pl.total_height for pl in panel_layouts)
-        total_width = sum(pl.total_width for pl in panel_layouts) + \
-            self._panel_gap * (len(panel_layouts) - 1)
-
-        return CompositeLayoutSpec(
-            panel_layouts=panel_layouts,
-            total_width=total_width,
-            total_height=total_height,
-            direction="horizontal",
-            panel_gap=self._panel_gap,
-        )
+        return self._arrange(panel_layouts, "horizontal")
 
     def compute_vertical(
         self,
         panel_layouts: list[LayoutSpec],
     ) -> CompositeLayoutSpec:
         """Arrange panels top-to-bottom."""
+        return self._arrange(panel_layouts, "vertical")
+
+    def _arrange(
+        self,
+        panel_layouts: list[LayoutSpec],
+        direction: str,
+    ) -> CompositeLayoutSpec:
+        """Stack panels along the direction; the cross axis takes the max."""
         if not panel_layouts:
             raise ValueError("At least one panel layout required.")
 
-        total_width = max(pl.total_width for pl in panel_layouts)
-        total_height = sum(pl.total_height for pl in panel_layouts) + \
-            self._panel_gap * (len(panel_layouts) - 1)
+        # Choose the stacking axis once, then one pass: sum along it, max across it
+        if direction == "horizontal":
+            along_attr, across_attr = "total_width", "total_height"
+        else:
+            along_attr, across_attr = "total_height", "total_width"
+        along = 0.0
+        across = 0.0
+        for pl in panel_layouts:
+            along += getattr(pl, along_attr)
+            across = max(across, getattr(pl, across_attr))
+        along += self._panel_gap * (len(panel_layouts) - 1)
+
+        if direction == "horizontal":
+            total_width, total_height = along, across
+        else:
+            total_width, total_height = across, along
 
         return CompositeLayoutSpec(
             panel_layouts=panel_layouts,
             total_width=total_width,
             total_height=total_height,
-            direction="vertical",
+            direction=direction,
             panel_gap=self._panel_gap,
         )
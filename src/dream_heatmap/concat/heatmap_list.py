@@ -4,10 +4,25 @@ from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
+
 from .composite_id_mapper import CompositeIDMapper
 from .composite_layout import CompositeLayoutComposer, CompositeLayoutSpec
 
 
+def _same_ids(a: np.ndarray, b: np.ndarray) -> bool:
+    """Whether two visual orders hold the same (unique) IDs, in any order.
+
+    Panels usually list the shared IDs in the same order, which an
+    element-wise comparison settles without building sets.
+    """
+    if a is b:
+        return True
+    if len(a) != len(b):
+        return False
+    return np.array_equal(a, b) or set(a.tolist()) == set(b.tolist())
+
+
 class HeatmapList:
     """Container for horizontally or vertically concatenated heatmaps.
 
@@ -51,19 +66,17 @@ class HeatmapList:
     def _validate_shared_axis(self) -> None:
         """Validate that panels share the correct axis."""
         if self._direction == "horizontal":
-            ref_rows = set(self._heatmaps[0]._row_mapper.visual_order.tolist())
+            ref_rows = self._heatmaps[0]._row_mapper.visual_order
             for i, hm in enumerate(self._heatmaps[1:], 1):
-                other_rows = set(hm._row_mapper.visual_order.tolist())
-                if ref_rows != other_rows:
+                if not _same_ids(ref_rows, hm._row_mapper.visual_order):
                     raise ValueError(
                         f"Horizontal concatenation requires all heatmaps to have "
                         f"the same row IDs. Heatmap 0 and {i} differ."
                     )
         else:
-            ref_cols = set(self._heatmaps[0]._col_mapper.visual_order.tolist())
+            ref_cols = self._heatmaps[0]._col_mapper.visual_order
             for i, hm in enumerate(self._heatmaps[1:], 1):
-                other_cols = set(hm._col_mapper.visual_order.tolist())
-                if ref_cols != other_cols:
+                if not _same_ids(ref_cols, hm._col_mapper.visual_order):
                     raise ValueError(
                         f"Vertical concatenation requires all heatmaps to have "
                         f"the same column IDs. Heatmap 0 and {i} differ."
@@ -2,11 +2,45 @@
 
 from __future__ import annotations
 
+import functools
+from pathlib import Path
+
 import numpy as np
 
 from .validation import validate_colormap_name
 
 
+# Pre-baked LUTs for the most common colormaps, so they need no matplotlib
+# import. Each entry is (colormaps[name](np.linspace(0, 1, 256)) * 255)
+# cast to uint8; regenerate the file if that recipe changes.
+_BUILTIN_LUTS_PATH = Path(__file__).with_name("_builtin_luts.npz")
+
+
+@functools.lru_cache(maxsize=None)
+def _builtin_luts() -> dict[str, np.ndarray]:
+    """Load the pre-baked {cmap_name: (256, 4) uint8 LUT} table."""
+    with np.load(_BUILTIN_LUTS_PATH) as data:
+        return {name: data[name] for name in data.files}
+
+
+@functools.lru_cache(maxsize=None)
+def _build_lut(cmap_name: str) -> np.ndarray:
+    """Build the read-only (256, 4) uint8 RGBA LUT for a colormap.
+
+    The LUT depends only on the colormap, so it is built once per name and
+    shared by every ColorScale using it. Built-in colormaps skip matplotlib.
+    """
+    lut = _builtin_luts().get(cmap_name)
+    if lut is None:
+        from matplotlib import colormaps
+        cmap = colormaps[cmap_name]
+        positions = np.linspace(0.0, 1.0, ColorScale.LUT_SIZE)
+        rgba_float = cmap(positions)  # (256, 4) float in [0, 1]
+        lut = (rgba_float * 255).astype(np.uint8)
+    lut.flags.writeable = False
+    return lut
+
+
 class ColorScale:
     """Maps scalar values to colors via a 256-entry RGBA lookup table.
 
@@ -14,7 +48,7 @@ class ColorScale:
     to JS as 1024 bytes (256 entries x 4 bytes RGBA).
     """
 
-    __slots__ = ("_lut", "_vmin", "_vmax", "_cmap_name", "_nan_color")
+    __slots__ = ("_lut", "_lut_bytes", "_vmin", "_vmax", "_cmap_name", "_nan_color")
 
     LUT_SIZE = 256
 
@@ -25,25 +59,19 @@ class ColorScale:
         vmax: float = 1.0,
         nan_color: tuple[int, int, int, int] = (200, 200, 200, 255),
     ) -> None:
-        validate_colormap_name(cmap_name)
+        if cmap_name not in _builtin_luts():
+            validate_colormap_name(cmap_name)
         self._cmap_name = cmap_name
         self._vmin = float(vmin)
         self._vmax = float(vmax)
         self._nan_color = nan_color
-        self._lut = self._build_lut()
-
-    def _build_lut(self) -> np.ndarray:
-        """Build a (256, 4) uint8 RGBA lookup table from the matplotlib cmap."""
-        import matplotlib.pyplot as plt
-        cmap = plt.get_cmap(self._cmap_name)
-        positions = np.linspace(0.0, 1.0, self.LUT_SIZE)
-        rgba_float = cmap(positions)  # (256, 4) float in [0, 1]
-        lut = (rgba_float * 255).astype(np.uint8)
-        return lut
+        self._lut = _build_lut(cmap_name)
+        # The LUT never changes after construction, so serialize it once
+        self._lut_bytes = self._lut.tobytes()
 
     @property
     def lut(self) -> np.ndarray:
-        """(256, 4) uint8 RGBA lookup table."""
+        """(256, 4) uint8 RGBA lookup table (read-only)."""
         return self._lut
 
     @property
@@ -60,7 +88,7 @@ class ColorScale:
 
     def to_bytes(self) -> bytes:
         """Serialize LUT as 1024 bytes (256 * 4 RGBA) for JS transfer."""
-        return self._lut.tobytes()
+        return self._lut_bytes
 
     def value_to_index(self, value: float) -> int:
         """Map a scalar value to a LUT index [0, 255]."""
@@ -70,6 +98,27 @@ class ColorScale:
         clamped = max(0.0, min(1.0, normalized))
         return int(clamped * 255)
 
+    def values_to_rgba(self, values: np.ndarray) -> np.ndarray:
+        """Map an array of values to colors (uint8, shape ``values.shape + (4,)``).
+
+        Indices are computed like value_to_index over the whole array, the
+        LUT rows are gathered in one step, and NaN values take the nan_color. The result is C-contiguous, so
+        ``.tobytes()`` gives packed RGBA pixels.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if self._vmax == self._vmin:
+            indices = np.full(values.shape, 127, dtype=np.uint8)
+        else:
+            normalized = (values - self._vmin) / (self._vmax - self._vmin)
+            # fmax/fmin clamp like clip but send NaN to 0 (recolored below)
+            clamped = np.fmin(np.fmax(normalized, 0.0), 1.0)
+            indices = (clamped * 255).astype(np.uint8)
+        rgba = self._lut[indices]
+        nan_mask = np.isnan(values)
+        if nan_mask.any():
+            rgba[nan_mask] = self._nan_color
+        return rgba
+
     @property
     def nan_color(self) -> tuple[int, int, int, int]:
         return self._nan_color
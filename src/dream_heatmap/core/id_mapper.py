@@ -6,6 +6,7 @@ Immutable — each transform returns a new IDMapper.
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass, field
 
 import numpy as np
@@ -21,6 +22,11 @@ class SplitGroup:
     def __len__(self) -> int:
         return len(self.ids)
 
+    @functools.cached_property
+    def id_set(self) -> frozenset:
+        """The group's IDs as a set (computed once)."""
+        return frozenset(self.ids.tolist())
+
 
 @dataclass(frozen=True)
 class IDMapper:
@@ -43,29 +49,73 @@ class IDMapper:
         arr = np.asarray(ids, dtype=object)
         if len(arr) == 0:
             raise ValueError("Cannot create IDMapper from empty ID list.")
-        if len(set(arr.tolist())) != len(arr):
+        # The set built for the uniqueness check is the mapper's (and its
+        # single group's) ID set, so keep it instead of rebuilding it later
+        id_set = frozenset(arr.tolist())
+        if len(id_set) != len(arr):
             raise ValueError("IDs must be unique.")
-        return cls(
-            visual_order=arr,
-            groups=(SplitGroup(name="__all__", ids=arr),),
-        )
+        group = SplitGroup(name="__all__", ids=arr)
+        group.__dict__["id_set"] = id_set
+        mapper = cls(visual_order=arr, groups=(group,))
+        mapper.__dict__["original_ids"] = id_set
+        return mapper
 
     @property
     def size(self) -> int:
         """Number of IDs in the visual order."""
         return len(self.visual_order)
 
-    @property
-    def original_ids(self) -> set:
-        """Set of all original IDs."""
-        return set(self.visual_order.tolist())
+    @functools.cached_property
+    def original_ids(self) -> frozenset:
+        """Set of all original IDs (computed once per mapper)."""
+        return frozenset(self.visual_order.tolist())
+
+    @functools.cached_property
+    def group_offsets(self) -> np.ndarray:
+        """Visual index where each group starts (read-only int64, one per group)."""
+        sizes = np.fromiter((len(g) for g in self.groups), np.int64, len(self.groups))
+        offsets = np.zeros(len(sizes), dtype=np.int64)
+        np.cumsum(sizes[:-1], out=offsets[1:])
+        offsets.flags.writeable = False
+        return offsets
+
+    @functools.cached_property
+    def id_strings(self) -> tuple[str, ...]:
+        """str() of each ID in visual order (computed once per mapper).
+
+        Label layout and label-space estimation both work on the strings;
+        a zoom slices them instead of converting again.
+        """
+        return tuple(map(str, self.visual_order.tolist()))
+
+    @functools.cached_property
+    def max_label_length(self) -> int:
+        """Length of the longest ID as a string (computed once per mapper).
+
+        Reorders and splits keep the same IDs, so they hand the value on to
+        the mapper they return instead of rescanning.
+        """
+        return max(map(len, self.id_strings))
+
+    def _carry_id_caches(self, mapper: IDMapper) -> IDMapper:
+        """Give a mapper over the same IDs this mapper's cached ID set and
+        label length (neither depends on the order)."""
+        for name in ("original_ids", "max_label_length"):
+            if name in self.__dict__:
+                mapper.__dict__[name] = self.__dict__[name]
+        return mapper
+
+    @functools.cached_property
+    def _positions(self) -> dict:
+        """{original ID: visual index}, built on first lookup."""
+        return {id_: i for i, id_ in enumerate(self.visual_order.tolist())}
 
     def visual_index_of(self, original_id: object) -> int | None:
         """Return the visual index of an original ID, or None if not found."""
-        matches = np.where(self.visual_order == original_id)[0]
-        if len(matches) == 0:
+        try:
+            return self._positions.get(original_id)
+        except TypeError:  # unhashable, so it can't be one of the IDs
             return None
-        return int(matches[0])
 
     def resolve_range(self, start: int, end: int) -> list:
         """Given visual index range [start, end), return original IDs.
@@ -83,15 +133,13 @@ class IDMapper:
 
         new_order must be a permutation of the current visual_order.
         """
-        current_set = set(self.visual_order.tolist())
-        new_set = set(new_order.tolist())
-        if current_set != new_set:
+        if self.original_ids != set(new_order.tolist()):
             raise ValueError("new_order must contain exactly the same IDs.")
-        return IDMapper(
+        return self._carry_id_caches(IDMapper(
             visual_order=np.asarray(new_order, dtype=object),
             gap_positions=self.gap_positions,
             groups=self.groups,
-        )
+        ))
 
     def apply_splits(
         self, assignments: dict[str, list]
@@ -106,14 +154,30 @@ class IDMapper:
         Returns a new IDMapper with groups ordered as given and gap
         positions marking group boundaries.
         """
-        # Validate all IDs accounted for
-        all_assigned = []
-        for ids in assignments.values():
-            all_assigned.extend(ids)
-        assigned_set = set(all_assigned)
-        if len(all_assigned) != len(assigned_set):
+        # Reverse index: each ID's group; a repeated ID collapses into one key
+        id_to_group: dict = {}
+        n_assigned = 0
+        for name, ids in assignments.items():
+            n_assigned += len(ids)
+            for id_ in ids:
+                id_to_group[id_] = name
+        if n_assigned != len(id_to_group):
             raise ValueError("Some IDs appear in multiple split groups.")
-        if assigned_set != self.original_ids:
+
+        # One pass over the current visual order buckets every ID into its
+        # group, preserving relative order within each group. With as many
+        # assigned IDs as there are IDs, every ID being found proves the
+        # assignment covers exactly this mapper's IDs.
+        buckets: dict[str, list] = {name: [] for name in assignments}
+        matched = len(id_to_group) == self.size
+        if matched:
+            try:
+                for x in self.visual_order.tolist():
+                    buckets[id_to_group[x]].append(x)
+            except KeyError:
+                matched = False
+        if not matched:
+            assigned_set = set(id_to_group)
             missing = self.original_ids - assigned_set
             extra = assigned_set - self.original_ids
             parts = []
@@ -127,20 +191,17 @@ class IDMapper:
         new_order: list = []
         gap_pos: set[int] = set()
 
-        for name, ids in assignments.items():
-            # Preserve relative order from current visual_order within each group
-            id_set = set(ids)
-            ordered = [x for x in self.visual_order.tolist() if x in id_set]
+        for name, ordered in buckets.items():
             if new_order:
                 gap_pos.add(len(new_order))
             groups.append(SplitGroup(name=name, ids=np.array(ordered, dtype=object)))
             new_order.extend(ordered)
 
-        return IDMapper(
+        return self._carry_id_caches(IDMapper(
             visual_order=np.array(new_order, dtype=object),
             gap_positions=frozenset(gap_pos),
             groups=tuple(groups),
-        )
+        ))
 
     def apply_reorder_within_groups(
         self,
@@ -163,7 +224,7 @@ class IDMapper:
             if group.name in group_orders:
                 new_order = np.asarray(group_orders[group.name], dtype=object)
                 # Validate it's a permutation of the group's IDs
-                if set(new_order.tolist()) != set(group.ids.tolist()):
+                if set(new_order.tolist()) != group.id_set:
                     raise ValueError(
                         f"Reorder for group '{group.name}' doesn't match "
                         f"the group's IDs."
@@ -174,11 +235,11 @@ class IDMapper:
                 new_groups.append(group)
                 new_visual.extend(group.ids.tolist())
 
-        return IDMapper(
+        return self._carry_id_caches(IDMapper(
             visual_order=np.array(new_visual, dtype=object),
             gap_positions=self.gap_positions,
             groups=tuple(new_groups),
-        )
+        ))
 
     def apply_zoom(self, start: int, end: int) -> IDMapper:
         """Return a new IDMapper for the zoomed-in range [start, end)."""
@@ -191,11 +252,14 @@ class IDMapper:
         new_gaps = frozenset(
             g - start for g in self.gap_positions if start < g < end
         )
-        return IDMapper(
+        mapper = IDMapper(
             visual_order=zoomed,
             gap_positions=new_gaps,
             groups=self.groups,  # keep original group info
         )
+        if "id_strings" in self.__dict__:
+            mapper.__dict__["id_strings"] = self.id_strings[start:end]
+        return mapper
 
     def apply_zoom_by_ids(self, ids: list) -> IDMapper:
         """Return a new IDMapper containing only the specified IDs.
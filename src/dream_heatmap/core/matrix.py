@@ -7,6 +7,9 @@ import pandas as pd
 
 from .validation import validate_dataframe_matrix
 
+# Encodings accepted by MatrixData.to_bytes (and understood by the JS decoder)
+MATRIX_DTYPES = ("float64", "float32")
+
 
 class MatrixData:
     """Immutable container for a validated numeric matrix.
@@ -15,13 +18,16 @@ class MatrixData:
     alongside the original row and column IDs.
     """
 
-    __slots__ = ("_values", "_row_ids", "_col_ids")
+    __slots__ = ("_values", "_row_ids", "_col_ids", "_row_index", "_col_index")
 
     def __init__(self, df: pd.DataFrame) -> None:
         df = validate_dataframe_matrix(df)
         self._values: np.ndarray = np.ascontiguousarray(df.values, dtype=np.float64)
         self._row_ids: np.ndarray = np.array(df.index, dtype=object)
         self._col_ids: np.ndarray = np.array(df.columns, dtype=object)
+        # Hash indexes over the IDs, built on first use (see row_index)
+        self._row_index: pd.Index | None = None
+        self._col_index: pd.Index | None = None
 
     @property
     def values(self) -> np.ndarray:
@@ -40,6 +46,20 @@ class MatrixData:
         """Original column IDs as object array."""
         return self._col_ids
 
+    @property
+    def row_index(self) -> pd.Index:
+        """Row IDs as a pd.Index, built once and shared by all ID lookups."""
+        if self._row_index is None:
+            self._row_index = pd.Index(self._row_ids)
+        return self._row_index
+
+    @property
+    def col_index(self) -> pd.Index:
+        """Column IDs as a pd.Index, built once and shared by all ID lookups."""
+        if self._col_index is None:
+            self._col_index = pd.Index(self._col_ids)
+        return self._col_index
+
     @property
     def shape(self) -> tuple[int, int]:
         return self._values.shape
@@ -52,12 +72,40 @@ class MatrixData:
     def n_cols(self) -> int:
         return self._values.shape[1]
 
-    def to_bytes(self) -> bytes:
-        """Serialize the matrix as row-major float64 bytes for JS transfer."""
-        return self._values.tobytes()
+    def to_bytes(self, dtype: str = "float64") -> bytes:
+        """Serialize the matrix as row-major bytes for JS transfer.
+
+        ``dtype="float32"`` halves the payload. Colors are unaffected (the
+        LUT has 256 entries) but hover values keep only ~7 significant
+        digits, and magnitudes beyond float32 range become +/-inf.
+        """
+        if dtype not in MATRIX_DTYPES:
+            raise ValueError(
+                f"Unsupported matrix dtype '{dtype}'. Use one of {MATRIX_DTYPES}."
+            )
+        if dtype == "float64":
+            return self._values.tobytes()
+        with np.errstate(over="ignore"):
+            return self._values.astype(np.float32).tobytes()
+
+    def as_memoryview(self) -> memoryview:
+        """Zero-copy, read-only view of the row-major float64 buffer.
+
+        Same content as ``to_bytes()``, for consumers that accept any
+        bytes-like object (e.g. ``base64.b64encode``).
+        """
+        return memoryview(self.values).cast("B")
 
     def finite_range(self) -> tuple[float, float]:
         """Return (min, max) of all finite values. Used for color scale defaults."""
+        # fmin/fmax skip NaN in one allocation-free pass each; only matrices
+        # holding infinities (or nothing finite) need the masked fallback
+        flat = self._values.ravel()
+        if flat.size:
+            lo = np.fmin.reduce(flat)
+            hi = np.fmax.reduce(flat)
+            if np.isfinite(lo) and np.isfinite(hi):
+                return (float(lo), float(hi))
         finite = self._values[np.isfinite(self._values)]
         if len(finite) == 0:
             return (0.0, 1.0)
@@ -75,13 +123,35 @@ class MatrixData:
         obj._values = np.ascontiguousarray(values, dtype=np.float64)
         obj._row_ids = np.asarray(row_ids, dtype=object)
         obj._col_ids = np.asarray(col_ids, dtype=object)
+        obj._row_index = None
+        obj._col_index = None
         return obj
 
     def slice(self, row_ids: np.ndarray, col_ids: np.ndarray) -> MatrixData:
         """Extract a submatrix for the given row/col IDs. Returns a new MatrixData."""
-        row_id_to_idx = {rid: i for i, rid in enumerate(self._row_ids)}
-        col_id_to_idx = {cid: i for i, cid in enumerate(self._col_ids)}
-        row_indices = np.array([row_id_to_idx[rid] for rid in row_ids])
-        col_indices = np.array([col_id_to_idx[cid] for cid in col_ids])
-        sub_values = self._values[np.ix_(row_indices, col_indices)]
+        row_indices = _positions(self.row_index, row_ids)
+        col_indices = _positions(self.col_index, col_ids)
+        rows, cols = _as_slice(row_indices), _as_slice(col_indices)
+        if isinstance(rows, slice) or isinstance(cols, slice):
+            # Basic/mixed indexing: a view, or a single gather along one axis
+            sub_values = self._values[rows, cols]
+        else:
+            sub_values = self._values[np.ix_(row_indices, col_indices)]
         return MatrixData.from_submatrix(sub_values, row_ids, col_ids)
+
+
+def _positions(index: pd.Index, wanted: np.ndarray) -> np.ndarray:
+    """Positions of the wanted IDs in index. Raises KeyError for unknown IDs."""
+    positions = index.get_indexer(wanted)
+    if (positions < 0).any():
+        missing = [w for w, p in zip(wanted, positions) if p < 0]
+        raise KeyError(missing[0])
+    return positions
+
+
+def _as_slice(indices: np.ndarray) -> slice | np.ndarray:
+    """Return an equivalent slice if indices are a contiguous ascending run."""
+    n = len(indices)
+    if n > 0 and indices[-1] - indices[0] == n - 1 and (np.diff(indices) == 1).all():
+        return slice(int(indices[0]), int(indices[0]) + n)
+    return indices
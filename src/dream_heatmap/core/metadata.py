@@ -2,11 +2,38 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 from .validation import validate_metadata
 
 
+_str_ufunc = np.frompyfunc(str, 1, 1)
+
+
+def str_values(values: pd.Series | np.ndarray) -> np.ndarray:
+    """str() of each value as iteration yields it, as an object array.
+
+    Category names, split group names and label text all go through this,
+    so the same column gives the same strings everywhere.
+    """
+    dtype = values.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in "biuf":
+        # numpy's conversion matches str() of the Python scalars (for
+        # floats once upcast to float64, as iteration does)
+        arr = np.asarray(values)
+        if dtype.kind == "f":
+            arr = arr.astype(np.float64, copy=False)
+        return arr.astype(str).astype(object)
+    if isinstance(dtype, np.dtype) and dtype.kind == "O":
+        # numpy's conversion would decode bytes, so call str() itself
+        return _str_ufunc(np.asarray(values))
+    # Extension/datetime dtypes: stringify only the distinct values
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    keys = np.array([str(u) for u in uniques], dtype=object)
+    return keys[codes]
+
+
 class MetadataFrame:
     """Immutable metadata container aligned with matrix row or column IDs.
 
@@ -23,8 +50,10 @@ class MetadataFrame:
         axis_name: str = "row",
     ) -> None:
         df = validate_metadata(df, expected_ids, axis_name)
-        # Reindex to match expected_ids order
-        self._df = df.loc[expected_ids].copy()
+        # Reindex to match expected_ids order, unless it already does
+        if not df.index.equals(expected_ids):
+            df = df.loc[expected_ids]
+        self._df = df.copy()
         self._df.flags.writeable = False
         self._axis_name = axis_name
 
@@ -47,7 +76,12 @@ class MetadataFrame:
     def get_categories(self, col: str) -> dict[str, list]:
         """Return {category: [ids]} mapping for a categorical column."""
         series = self.get_column(col)
-        groups: dict[str, list] = {}
-        for idx, val in series.items():
-            groups.setdefault(str(val), []).append(idx)
-        return groups
+        codes, keys = pd.factorize(str_values(series))
+        # Categories in order of first appearance, IDs in row order
+        order = np.argsort(codes, kind="stable")
+        bounds = np.cumsum(np.bincount(codes, minlength=len(keys)))[:-1]
+        ids = series.index.to_numpy()[order]
+        return {
+            str(key): group.tolist()
+            for key, group in zip(keys, np.split(ids, bounds))
+        }
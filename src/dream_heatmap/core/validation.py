@@ -4,8 +4,13 @@ from __future__ import annotations
 
 from typing import Any
 
-import numpy as np
 import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+
+
+def _is_number_dtype(dtype: Any) -> bool:
+    """True for numeric, non-boolean dtypes (timedelta counts as non-numeric)."""
+    return is_numeric_dtype(dtype) and not is_bool_dtype(dtype)
 
 
 def validate_dataframe_matrix(data: Any) -> pd.DataFrame:
@@ -32,10 +37,11 @@ def validate_dataframe_matrix(data: Any) -> pd.DataFrame:
             f"Column IDs must be unique. Found duplicates: {dupes[:5]}"
             + (f" (and {len(dupes) - 5} more)" if len(dupes) > 5 else "")
         )
-    # Check numeric
-    numeric_df = data.select_dtypes(include=[np.number])
-    if numeric_df.shape[1] != data.shape[1]:
-        non_numeric = [c for c in data.columns if c not in numeric_df.columns]
+    # Check numeric, once per distinct dtype (wide frames share a few dtypes)
+    dtypes = data.dtypes
+    bad = {dt for dt in set(dtypes) if not _is_number_dtype(dt)}
+    if bad:
+        non_numeric = [c for c, dt in dtypes.items() if dt in bad]
         raise TypeError(
             f"All columns must be numeric. Non-numeric columns: {non_numeric[:5]}"
             + (f" (and {len(non_numeric) - 5} more)" if len(non_numeric) > 5 else "")
@@ -66,6 +72,9 @@ def validate_metadata(
         raise ValueError(
             f"{axis_name} metadata has duplicate IDs: {dupes[:5]}"
         )
+    if metadata.index.equals(expected_ids):
+        # Already aligned (the common case): no set differences to hash
+        return metadata
     missing = expected_ids.difference(metadata.index)
     if len(missing) > 0:
         raise ValueError(
@@ -85,13 +94,11 @@ def validate_metadata(
 
 def validate_colormap_name(name: str) -> str:
     """Validate that a matplotlib colormap name exists."""
-    import matplotlib.pyplot as plt
+    from matplotlib import colormaps
 
-    try:
-        plt.get_cmap(name)
-    except ValueError:
+    if name not in colormaps:
         raise ValueError(
             f"Unknown colormap '{name}'. Use a matplotlib colormap name "
             f"like 'viridis', 'plasma', 'RdBu_r', etc."
-        ) from None
+        )
     return name
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+
 import panel as pn
 import pandas as pd
 
@@ -221,6 +223,17 @@ body, .mdc-typography {
 """
 
 
+@functools.lru_cache(maxsize=1)
+def _configure_panel() -> None:
+    """Load the Panel extensions and inject the dashboard CSS (once per process)."""
+    pn.extension("plotly", sizing_mode="stretch_width")
+
+    # Inject custom CSS and loading spinner color
+    if _DASHBOARD_CSS not in pn.config.raw_css:
+        pn.config.raw_css.append(_DASHBOARD_CSS)
+    pn.config.loading_color = "#5c6ac4"
+
+
 class DashboardApp:
     """Interactive heatmap dashboard application.
 
@@ -236,11 +249,7 @@ class DashboardApp:
         row_metadata: pd.DataFrame | None = None,
         col_metadata: pd.DataFrame | None = None,
     ) -> None:
-        pn.extension("plotly", sizing_mode="stretch_width")
-
-        # Inject custom CSS and loading spinner color
-        pn.config.raw_css.append(_DASHBOARD_CSS)
-        pn.config.loading_color = "#5c6ac4"
+        _configure_panel()
 
         # Create the heatmap pane (JSComponent)
         self.heatmap_pane = HeatmapPane(
@@ -283,6 +292,9 @@ class DashboardApp:
         )
         self.sidebar_controls = SidebarControls(self.state, chart_manager=self.chart_manager)
 
+        # Template is assembled on first serve() and reused afterwards
+        self._template: pn.template.MaterialTemplate | None = None
+
         # Trigger initial render
         self.state.trigger_rebuild()
 
@@ -347,9 +359,10 @@ class DashboardApp:
         **kwargs
             Additional keyword arguments passed to pn.serve().
         """
-        template = self._build_template()
+        if self._template is None:
+            self._template = self._build_template()
         pn.serve(
-            template,
+            self._template,
             port=port or 0,
             show=show,
             title="dream-heatmap Explorer",
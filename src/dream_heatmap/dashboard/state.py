@@ -12,7 +12,6 @@ import pandas as pd
 from ..api import Heatmap
 from ..annotation.categorical import CategoricalAnnotation
 from ..annotation.minigraph import BarChartAnnotation
-from ..layout.annotation_layout import AnnotationLayoutEngine
 from ..display_utils import prettify_name
 
 
@@ -511,18 +510,7 @@ class DashboardState(param.Parameterized):
                 zoomed_col,
                 has_row_dendro=(hm._row_cluster is not None and hm._show_row_dendro),
                 has_col_dendro=(hm._col_cluster is not None and hm._show_col_dendro),
-                left_annotation_width=AnnotationLayoutEngine.total_edge_width(
-                    hm._annotations["left"]
-                ),
-                right_annotation_width=AnnotationLayoutEngine.total_edge_width(
-                    hm._annotations["right"]
-                ),
-                top_annotation_height=AnnotationLayoutEngine.total_edge_width(
-                    hm._annotations["top"]
-                ),
-                bottom_annotation_height=AnnotationLayoutEngine.total_edge_width(
-                    hm._annotations["bottom"]
-                ),
+                **hm._annotation_extents,
                 legend_panel_width=legend_w,
                 legend_panel_height=legend_h,
                 left_label_width=left_lbl_w,
@@ -13,7 +13,7 @@ from ..core.color_scale import ColorScale
 from ..core.id_mapper import IDMapper
 from ..layout.composer import LayoutSpec
 from ..widget.serializers import (
-    serialize_matrix,
+    serialize_matrix_b64,
     serialize_color_lut,
     serialize_layout,
     serialize_id_mappers,
@@ -66,10 +66,9 @@ class HTMLExporter:
         path = pathlib.Path(path)
 
         # Serialize data
-        matrix_bytes = serialize_matrix(matrix)
         lut_bytes = serialize_color_lut(color_scale)
 
-        matrix_b64 = base64.b64encode(matrix_bytes).decode("ascii")
+        matrix_b64 = serialize_matrix_b64(matrix)
         lut_b64 = base64.b64encode(lut_bytes).decode("ascii")
 
         layout_json = serialize_layout(layout)
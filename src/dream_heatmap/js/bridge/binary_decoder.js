@@ -3,21 +3,25 @@
  */
 
 /**
- * Decode a row-major float64 byte buffer into a Float64Array.
+ * Decode a row-major float64 (or float32) byte buffer into a typed array.
  * @param {ArrayBuffer|DataView|Uint8Array} buffer
- * @returns {Float64Array}
+ * @param {string} [dtype="float64"] - "float64" or "float32"
+ * @returns {Float64Array|Float32Array}
  */
-function decodeMatrixBytes(buffer) {
+function decodeMatrixBytes(buffer, dtype = "float64") {
+  const ArrayType = dtype === "float32" ? Float32Array : Float64Array;
   if (buffer instanceof Uint8Array) {
     // Ensure aligned access
     const aligned = new ArrayBuffer(buffer.byteLength);
     new Uint8Array(aligned).set(buffer);
-    return new Float64Array(aligned);
+    return new ArrayType(aligned);
   }
   if (buffer instanceof DataView) {
-    return new Float64Array(buffer.buffer, buffer.byteOffset, buffer.byteLength / 8);
+    return new ArrayType(
+      buffer.buffer, buffer.byteOffset, buffer.byteLength / ArrayType.BYTES_PER_ELEMENT,
+    );
   }
-  return new Float64Array(buffer);
+  return new ArrayType(buffer);
 }
 
 /**
@@ -34,3 +38,27 @@ function decodeColorLUT(buffer) {
   }
   return new Uint8Array(buffer);
 }
+
+/**
+ * Decode a base64 row-major float32 buffer (annotation payloads) into rows.
+ * NaN entries become null; rows without any finite value become null.
+ * @param {string} b64
+ * @param {number[]} shape - [nRows, nCols]
+ * @returns {Array<Array<number|null>|null>}
+ */
+function decodeFloat32Rows(b64, shape) {
+  const bin = atob(b64);
+  const bytes = new Uint8Array(bin.length);
+  for (let i = 0; i < bin.length; i++) bytes[i] = bin.charCodeAt(i);
+  const values = new Float32Array(bytes.buffer);
+  const [nRows, nCols] = shape;
+  const rows = new Array(nRows);
+  for (let i = 0; i < nRows; i++) {
+    const row = Array.from(
+      values.subarray(i * nCols, (i + 1) * nCols),
+      v => (Number.isNaN(v) ? null : v),
+    );
+    rows[i] = row.some(v => v !== null) ? row : null;
+  }
+  return rows;
+}
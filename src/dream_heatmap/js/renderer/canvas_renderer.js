@@ -15,7 +15,7 @@ class CanvasRenderer {
   /**
    * Render the full heatmap grid.
    *
-   * @param {Float64Array} matrix - row-major float64 data
+   * @param {Float64Array|Float32Array} matrix - row-major matrix data
    * @param {object} layout - {rowPositions, colPositions, rowCellSize, colCellSize, nRows, nCols, heatmap}
    * @param {ColorMapper} colorMapper
    */
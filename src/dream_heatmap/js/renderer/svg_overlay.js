@@ -751,9 +751,12 @@ class SVGOverlay {
     const isRow = (edge === "left" || edge === "right");
     const area = this._getTrackRect(edge, track.offset, track.trackWidth, heatmap);
     const range = track.vmax - track.vmin || 1;
+    const allSeries = track.seriesB64 !== undefined
+      ? decodeFloat32Rows(track.seriesB64, track.seriesShape)
+      : track.series;
 
-    for (let i = 0; i < track.series.length; i++) {
-      const series = track.series[i];
+    for (let i = 0; i < allSeries.length; i++) {
+      const series = allSeries[i];
       if (!series || series.length < 2) continue;
 
       const n = series.length;
@@ -910,12 +913,16 @@ class SVGOverlay {
   _renderViolin(track, edge, positions, cellSize, heatmap, secondaryGaps) {
     const isRow = (edge === "left" || edge === "right");
     const area = this._getTrackRect(edge, track.offset, track.trackWidth, heatmap);
+    // Per-row normalized counts; the bin centers are shared by all rows
+    const allCounts = track.densitiesB64 !== undefined
+      ? decodeFloat32Rows(track.densitiesB64, track.densitiesShape)
+      : track.densities.map(d => (d ? d.counts : null));
+    const centers = track.centers;
 
-    for (let i = 0; i < track.densities.length; i++) {
-      const d = track.densities[i];
-      if (!d) continue;
+    for (let i = 0; i < allCounts.length; i++) {
+      const counts = allCounts[i];
+      if (!counts) continue;
 
-      const { counts, centers } = d;
       const range = track.vmax - track.vmin || 1;
 
       if (isRow) {
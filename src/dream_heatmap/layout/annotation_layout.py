@@ -20,6 +20,15 @@ class AnnotationTrackSpec:
     track_width: float  # pixel width of this track
     render_data: dict   # serialized data for JS rendering
 
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "edge": self.edge,
+            "offset": self.offset,
+            "trackWidth": self.track_width,
+            "renderData": self.render_data,
+        }
+
 
 class AnnotationLayoutEngine:
     """Computes annotation track positions for one or more edges.
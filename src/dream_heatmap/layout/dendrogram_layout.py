@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
+
 from ..transform.cluster import DendrogramNode, ClusterResult
 from .cell_layout import CellLayout
 
@@ -42,20 +44,107 @@ class DendrogramLink:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class DendrogramSpec:
-    """Complete dendrogram rendering specification."""
+    """Complete dendrogram rendering specification.
+
+    Links are stored column-wise: one float64 array per coordinate, with
+    link i made of element i of each array and member_ids[i]. Use
+    from_links() to build one from DendrogramLink objects.
+    """
 
-    links: tuple[DendrogramLink, ...]
+    # Leaf-axis positions (pixel), one entry per link
+    leaf_left: np.ndarray
+    leaf_right: np.ndarray
+    # Height-axis positions (pixel), one entry per link
+    height_merge: np.ndarray
+    height_left_child: np.ndarray
+    height_right_child: np.ndarray
+    # Member IDs of each link's subtree
+    member_ids: tuple[tuple, ...]
     # Which side: "left", "right", "top", "bottom"
     side: str
     # Pixel region for the dendrogram
     offset: float   # start of the dendrogram area on the height axis
     extent: float   # total size of the dendrogram on the height axis
 
+    @classmethod
+    def from_links(
+        cls,
+        links: tuple[DendrogramLink, ...] | list[DendrogramLink],
+        side: str,
+        offset: float,
+        extent: float,
+    ) -> DendrogramSpec:
+        """Build a spec from DendrogramLink objects (the pre-array form)."""
+        def column(name: str) -> np.ndarray:
+            return np.array([getattr(link, name) for link in links], dtype=np.float64)
+
+        return cls(
+            leaf_left=column("leaf_left"),
+            leaf_right=column("leaf_right"),
+            height_merge=column("height_merge"),
+            height_left_child=column("height_left_child"),
+            height_right_child=column("height_right_child"),
+            member_ids=tuple(link.member_ids for link in links),
+            side=side,
+            offset=offset,
+            extent=extent,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        # The generated __eq__ would compare arrays with ==, which is ambiguous
+        if not isinstance(other, DendrogramSpec):
+            return NotImplemented
+        return (
+            (self.member_ids, self.side, self.offset, self.extent)
+            == (other.member_ids, other.side, other.offset, other.extent)
+            and all(
+                np.array_equal(mine, theirs)
+                for mine, theirs in zip(self._coordinate_arrays(), other._coordinate_arrays())
+            )
+        )
+
+    @property
+    def links(self) -> tuple[DendrogramLink, ...]:
+        """The links as DendrogramLink objects."""
+        return tuple(
+            DendrogramLink(*coords, member_ids=members)
+            for *coords, members in zip(*self._coordinate_lists(), self.member_ids)
+        )
+
+    def link_dicts(self) -> list[dict]:
+        """The links in DendrogramLink.to_dict() form, for JS transfer."""
+        return [
+            {
+                "leafLeft": leaf_left,
+                "leafRight": leaf_right,
+                "heightMerge": height_merge,
+                "heightLeftChild": height_left,
+                "heightRightChild": height_right,
+                "memberIds": list(members),
+            }
+            for leaf_left, leaf_right, height_merge, height_left, height_right, members
+            in zip(*self._coordinate_lists(), self.member_ids)
+        ]
+
+    def _coordinate_arrays(self) -> tuple[np.ndarray, ...]:
+        """The five coordinate arrays, in DendrogramLink field order."""
+        return (
+            self.leaf_left,
+            self.leaf_right,
+            self.height_merge,
+            self.height_left_child,
+            self.height_right_child,
+        )
+
+    def _coordinate_lists(self) -> tuple[list[float], ...]:
+        """Coordinate arrays as Python float lists (one tolist() each)."""
+        return tuple(array.tolist() for array in self._coordinate_arrays())
+
     def to_dict(self) -> dict:
         return {
-            "links": [link.to_dict() for link in self.links],
+            "links": self.link_dicts(),
             "side": self.side,
             "offset": self.offset,
             "extent": self.extent,
@@ -101,54 +190,43 @@ class DendrogramLayout:
         if not nodes:
             return None
 
+        n = len(nodes)
+        left = np.fromiter((node.left for node in nodes), np.float64, n)
+        right = np.fromiter((node.right for node in nodes), np.float64, n)
+        heights = np.fromiter((node.height for node in nodes), np.float64, n)
+        left_heights = np.fromiter((node.left_height for node in nodes), np.float64, n)
+        right_heights = np.fromiter((node.right_height for node in nodes), np.float64, n)
+
         # Find max height for scaling
-        max_height = max(n.height for n in nodes) if nodes else 1.0
+        max_height = heights.max()
         if max_height == 0:
             max_height = 1.0
 
-        links: list[DendrogramLink] = []
-        for node in nodes:
+        return DendrogramSpec(
             # Map leaf positions to pixel centers
-            leaf_left = DendrogramLayout._leaf_to_pixel(
-                node.left, cell_layout, group_offset
-            )
-            leaf_right = DendrogramLayout._leaf_to_pixel(
-                node.right, cell_layout, group_offset
-            )
-
+            leaf_left=DendrogramLayout._leaves_to_pixels(left, cell_layout, group_offset),
+            leaf_right=DendrogramLayout._leaves_to_pixels(right, cell_layout, group_offset),
             # Map heights to pixel positions
-            height_merge = (node.height / max_height) * dendro_height
-            height_left = (node.left_height / max_height) * dendro_height
-            height_right = (node.right_height / max_height) * dendro_height
-
-            links.append(DendrogramLink(
-                leaf_left=leaf_left,
-                leaf_right=leaf_right,
-                height_merge=height_merge,
-                height_left_child=height_left,
-                height_right_child=height_right,
-                member_ids=node.member_ids,
-            ))
-
-        return DendrogramSpec(
-            links=tuple(links),
+            height_merge=(heights / max_height) * dendro_height,
+            height_left_child=(left_heights / max_height) * dendro_height,
+            height_right_child=(right_heights / max_height) * dendro_height,
+            member_ids=tuple(node.member_ids for node in nodes),
             side=side,
             offset=0.0,
             extent=dendro_height,
         )
 
     @staticmethod
-    def _leaf_to_pixel(
-        leaf_pos: float,
+    def _leaves_to_pixels(
+        leaf_pos: np.ndarray,
         cell_layout: CellLayout,
         group_offset: int,
-    ) -> float:
-        """Convert a leaf position (float index) to a pixel center."""
-        # leaf_pos is a float in [0, n-1] range (center of leaves)
-        idx = int(round(leaf_pos))
-        idx = max(0, min(idx, cell_layout._n_cells - 1))
-        actual_idx = group_offset + idx
-        if actual_idx < len(cell_layout.positions):
-            return cell_layout.positions[actual_idx] + cell_layout.cell_size / 2
-        # Fallback for edge cases
-        return cell_layout.positions[-1] + cell_layout.cell_size / 2
+    ) -> np.ndarray:
+        """Convert leaf positions (float indices) to pixel centers."""
+        # leaf_pos is a float in [0, n-1] range (center of leaves); rint
+        # rounds half to even like round()
+        idx = np.clip(np.rint(leaf_pos).astype(np.intp), 0, cell_layout._n_cells - 1)
+        positions = cell_layout.positions
+        # Indices past the end (edge cases) fall back to the last cell
+        actual_idx = np.minimum(group_offset + idx, len(positions) - 1)
+        return positions[actual_idx] + cell_layout.cell_size / 2
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 import numpy as np
@@ -46,41 +47,74 @@ class LabelLayoutEngine:
         min_spacing : minimum pixel distance between labels.
                       Defaults to font_size * 1.2.
         """
-        if mode == "none":
-            return []
+        texts, positions, visible = LabelLayoutEngine._place(
+            ids, cell_layout, mode, font_size, min_spacing,
+        )
+        return [
+            LabelSpec(text=text, position=pos, visible=vis)
+            for text, pos, vis in zip(texts, positions, visible)
+        ]
 
-        if min_spacing is None:
-            min_spacing = font_size * 1.2
+    @staticmethod
+    def compute_serialized(
+        ids: np.ndarray,
+        cell_layout: CellLayout,
+        mode: str = "auto",
+        font_size: float = 10.0,
+        min_spacing: float | None = None,
+        texts: Sequence[str] | None = None,
+    ) -> list[dict]:
+        """Same as serialize(compute(...)), without the LabelSpec objects.
 
-        n = len(ids)
-        labels = []
+        texts, if given, are the ids already converted with str() (such as
+        IDMapper.id_strings) and are used instead of converting again.
+        """
+        texts, positions, visible = LabelLayoutEngine._place(
+            ids, cell_layout, mode, font_size, min_spacing, texts,
+        )
+        font_size = float(font_size)
+        return [
+            {"text": text, "position": pos, "visible": vis, "fontSize": font_size}
+            for text, pos, vis in zip(texts, positions, visible)
+        ]
 
-        if mode == "all":
-            for i in range(n):
-                pos = cell_layout.positions[i] + cell_layout.cell_size / 2
-                labels.append(LabelSpec(
-                    text=str(ids[i]),
-                    position=pos,
-                    visible=True,
-                ))
-        elif mode == "auto":
-            last_pos = -float("inf")
-            for i in range(n):
-                pos = cell_layout.positions[i] + cell_layout.cell_size / 2
-                visible = (pos - last_pos) >= min_spacing
-                labels.append(LabelSpec(
-                    text=str(ids[i]),
-                    position=pos,
-                    visible=visible,
-                ))
-                if visible:
-                    last_pos = pos
-        else:
+    @staticmethod
+    def _place(
+        ids: np.ndarray,
+        cell_layout: CellLayout,
+        mode: str,
+        font_size: float,
+        min_spacing: float | None,
+        texts: Sequence[str] | None = None,
+    ) -> tuple[Sequence[str], list[float], list[bool]]:
+        """Label texts, cell-center positions and visibility flags."""
+        if mode not in ("all", "auto", "none"):
             raise ValueError(
                 f"Unknown label mode '{mode}'. Use 'all', 'auto', or 'none'."
             )
+        if mode == "none":
+            return [], [], []
+
+        if min_spacing is None:
+            min_spacing = font_size * 1.2
+
+        if texts is None:
+            texts = [str(i) for i in np.asarray(ids).tolist()]
+        centers = cell_layout.positions[:len(texts)] + cell_layout.cell_size / 2
+        positions = centers.tolist()
 
-        return labels
+        if mode == "all":
+            return texts, positions, [True] * len(positions)
+
+        # auto: greedily keep labels at least min_spacing past the last shown
+        visible = []
+        last_pos = -float("inf")
+        for pos in positions:
+            vis = (pos - last_pos) >= min_spacing
+            visible.append(vis)
+            if vis:
+                last_pos = pos
+        return texts, positions, visible
 
     @staticmethod
     def serialize(labels: list[LabelSpec], font_size: float = 10.0) -> list[dict]:
@@ -2,11 +2,32 @@
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
+from types import ModuleType
 
 import numpy as np
 
 
+# Linkage methods fastcluster can run on raw observations (euclidean only)
+# without materializing the condensed distance matrix
+_VECTOR_METHODS = {"single", "ward", "centroid", "median"}
+
+# Linkage of fewer than two items, shared read-only by all such results
+_EMPTY_LINKAGE = np.empty((0, 4))
+_EMPTY_LINKAGE.flags.writeable = False
+
+
+@functools.lru_cache(maxsize=None)
+def _fastcluster() -> ModuleType | None:
+    """Return the optional fastcluster module (faster linkage), or None."""
+    try:
+        import fastcluster
+    except ImportError:
+        return None
+    return fastcluster
+
+
 @dataclass(frozen=True)
 class DendrogramNode:
     """A single branch/merge in the dendrogram tree.
@@ -37,11 +58,25 @@ class ClusterResult:
     dendrogram_nodes: tuple[DendrogramNode, ...]  # for rendering
     ids: np.ndarray              # original IDs (in input order)
 
+    @classmethod
+    def unclustered(cls, ids: np.ndarray) -> ClusterResult:
+        """Result for fewer than two IDs: input order, no linkage or dendrogram.
+
+        ids is referenced, not copied, so it must not be modified afterwards.
+        """
+        return cls(
+            leaf_order=ids,
+            linkage_matrix=_EMPTY_LINKAGE,
+            dendrogram_nodes=(),
+            ids=ids,
+        )
+
 
 class ClusterEngine:
     """Hierarchical clustering with deterministic ordering.
 
-    Wraps scipy.cluster.hierarchy to produce:
+    Wraps scipy.cluster.hierarchy (using fastcluster for the linkage step
+    when it is installed) to produce:
     1. A leaf ordering for reordering the IDMapper
     2. Dendrogram node data for rendering
     """
@@ -97,28 +132,41 @@ class ClusterEngine:
         n = data.shape[0]
         if n < 2:
             # Single item — no clustering needed
-            return ClusterResult(
-                leaf_order=ids.copy(),
-                linkage_matrix=np.empty((0, 4)),
-                dendrogram_nodes=(),
-                ids=ids.copy(),
-            )
+            return ClusterResult.unclustered(ids.copy())
 
         # Handle NaN: replace with row mean for distance computation
         clean_data = cls._handle_nan(data)
 
         # Lazy import scipy (heavy, ~1-2s cold start)
-        from scipy.cluster.hierarchy import linkage, leaves_list
+        from scipy.cluster.hierarchy import linkage, leaves_list, optimal_leaf_ordering
         from scipy.spatial.distance import pdist
 
-        # Compute distances and linkage
         if metric == "correlation" and method == "ward":
             # Ward requires euclidean; fall back silently
-            dist = pdist(clean_data, metric="euclidean")
+            metric = "euclidean"
+
+        # Compute distances and linkage; fastcluster (if installed) produces
+        # the same SciPy-format linkage matrix, faster
+        fastcluster = _fastcluster()
+        # A pair merges once, at its distance, under every method and leaf
+        # ordering, so it needs no linkage search (a non-finite distance
+        # still goes through linkage, which rejects it)
+        pair_dist = pdist(clean_data, metric=metric)[0] if n == 2 else np.nan
+        if np.isfinite(pair_dist):
+            Z = np.array([[0.0, 1.0, pair_dist, 2.0]])
+        elif fastcluster is None:
+            Z = linkage(
+                pdist(clean_data, metric=metric),
+                method=method,
+                optimal_ordering=optimal_ordering,
+            )
+        elif metric == "euclidean" and method in _VECTOR_METHODS and not optimal_ordering:
+            Z = fastcluster.linkage_vector(clean_data, method=method)
         else:
             dist = pdist(clean_data, metric=metric)
-
-        Z = linkage(dist, method=method, optimal_ordering=optimal_ordering)
+            Z = fastcluster.linkage(dist, method=method)
+            if optimal_ordering:
+                Z = optimal_leaf_ordering(Z, dist)
 
         # Get leaf order
         leaf_indices = leaves_list(Z)
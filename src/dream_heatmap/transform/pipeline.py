@@ -110,12 +110,7 @@ class TransformPipeline:
             for group in mapper.groups:
                 group_ids = group.ids
                 if len(group_ids) < 2:
-                    cluster_results[group.name] = ClusterResult(
-                        leaf_order=group_ids.copy(),
-                        linkage_matrix=np.empty((0, 4)),
-                        dendrogram_nodes=(),
-                        ids=group_ids.copy(),
-                    )
+                    cluster_results[group.name] = ClusterResult.unclustered(group_ids)
                     continue
 
                 # Extract submatrix
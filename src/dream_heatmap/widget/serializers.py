@@ -2,18 +2,55 @@
 
 from __future__ import annotations
 
+import base64
 import json
 from typing import Any
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON with native ndarray support
+    orjson = None
+
 from ..core.matrix import MatrixData
 from ..core.color_scale import ColorScale
 from ..core.id_mapper import IDMapper
 from ..layout.composer import LayoutSpec
 
 
-def serialize_matrix(matrix: MatrixData) -> bytes:
-    """Serialize matrix as row-major float64 bytes."""
-    return matrix.to_bytes()
+def _json_default(obj: Any) -> Any:
+    """Convert NumPy arrays and scalars that the JSON encoder can't handle."""
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj: Any) -> str:
+    """JSON-encode obj, serializing NumPy arrays straight from their buffers.
+
+    Uses orjson when installed; otherwise falls back to the stdlib encoder,
+    which converts arrays to lists first.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=_json_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        ).decode("utf-8")
+    return json.dumps(obj, default=_json_default)
+
+
+def serialize_matrix(matrix: MatrixData, dtype: str = "float64") -> bytes:
+    """Serialize matrix as row-major float64 (or float32) bytes."""
+    return matrix.to_bytes(dtype)
+
+
+def serialize_matrix_b64(matrix: MatrixData, dtype: str = "float64") -> str:
+    """Serialize matrix as base64 text (float64 is encoded without a copy)."""
+    if dtype == "float64":
+        return base64.b64encode(matrix.as_memoryview()).decode("ascii")
+    return base64.b64encode(matrix.to_bytes(dtype)).decode("ascii")
 
 
 def serialize_color_lut(color_scale: ColorScale) -> bytes:
@@ -23,7 +60,7 @@ def serialize_color_lut(color_scale: ColorScale) -> bytes:
 
 def serialize_layout(layout: LayoutSpec) -> str:
     """Serialize layout spec as JSON string."""
-    return json.dumps(layout.to_dict())
+    return _dumps(layout.to_dict())
 
 
 def serialize_id_mappers(
@@ -31,7 +68,7 @@ def serialize_id_mappers(
     col_mapper: IDMapper,
 ) -> str:
     """Serialize row and col IDMappers as JSON string."""
-    return json.dumps({
+    return _dumps({
         "row": row_mapper.to_dict(),
         "col": col_mapper.to_dict(),
     })
@@ -52,4 +89,4 @@ def serialize_config(
         "cmapName": cmap_name,
         **extra,
     }
-    return json.dumps(config)
+    return _dumps(config)
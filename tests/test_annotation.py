@@ -1,10 +1,16 @@
 """Tests for Phase 5: Annotations, labels, and layout integration."""
 
+import base64
+
 import numpy as np
 import pandas as pd
 import pytest
 
-from dream_heatmap.annotation.base import AnnotationTrack, VALID_EDGES, DEFAULT_TRACK_WIDTH
+from dream_heatmap.annotation.base import (
+    AnnotationTrack,
+    VALID_EDGES,
+    DEFAULT_TRACK_WIDTH,
+)
 from dream_heatmap.annotation.categorical import CategoricalAnnotation, DEFAULT_CATEGORY_COLORS
 from dream_heatmap.annotation.label import LabelAnnotation
 from dream_heatmap.annotation.minigraph import (
@@ -23,6 +29,10 @@ from dream_heatmap.layout.cell_layout import CellLayout
 from dream_heatmap.core.id_mapper import IDMapper
 
 
+def _decode_float32(b64, shape):
+    return np.frombuffer(base64.b64decode(b64), dtype="<f4").reshape(shape)
+
+
 # --- Fixtures ---
 
 @pytest.fixture
@@ -76,6 +86,21 @@ class TestDefaultCategoryColors:
 
 
 class TestCategoricalAnnotation:
+    def test_datetime_categories_match_metadata_groups(self):
+        from dream_heatmap.core.metadata import MetadataFrame
+
+        ids = pd.Index(["a", "b", "c"])
+        dates = pd.Series(
+            pd.to_datetime(["2020-01-01", "2020-01-02", "2020-01-01"]), index=ids,
+        )
+        ann = CategoricalAnnotation("day", dates)
+        assert ann.categories == ["2020-01-01 00:00:00", "2020-01-02 00:00:00"]
+        data = ann.get_render_data(np.array(["c", "b"], dtype=object))
+        assert data["cellLabels"] == ["2020-01-01 00:00:00", "2020-01-02 00:00:00"]
+
+        mf = MetadataFrame(dates.to_frame("day"), ids, "row")
+        assert list(mf.get_categories("day")) == ann.categories
+
     def test_basic_creation(self, categorical_series):
         ann = CategoricalAnnotation("cell_type", categorical_series)
         assert ann.name == "cell_type"
@@ -121,6 +146,19 @@ class TestCategoricalAnnotation:
         data = ann.get_render_data(np.array(["gene_A", "unknown_gene"], dtype=object))
         assert data["cellColors"][1] == "#cccccc"
 
+    def test_cell_labels_in_visual_order(self, categorical_series):
+        ann = CategoricalAnnotation("cell_type", categorical_series)
+        order = np.array(["gene_D", "unknown_gene", "gene_B"], dtype=object)
+        data = ann.get_render_data(order)
+        assert data["cellLabels"] == ["NK-cell", "", "B-cell"]
+
+    def test_duplicate_ids_use_first_value(self):
+        values = pd.Series(["T", "B", "NK"], index=["a", "b", "a"])
+        ann = CategoricalAnnotation("ct", values)
+        data = ann.get_render_data(np.array(["a", "b"], dtype=object))
+        assert data["cellLabels"] == ["T", "B"]
+        assert ann.categories == ["T", "B"]
+
     def test_legend(self, categorical_series):
         ann = CategoricalAnnotation("cell_type", categorical_series)
         data = ann.get_render_data(np.array(["gene_A"], dtype=object))
@@ -141,6 +179,14 @@ class TestCategoricalAnnotation:
 # --- LabelAnnotation ---
 
 class TestLabelAnnotation:
+    def test_values_and_ids_use_str(self):
+        values = pd.Series(
+            pd.to_datetime(["2020-01-01", "2020-01-02"]), index=[b"x", "y"],
+        )
+        ann = LabelAnnotation("day", values)
+        data = ann.get_render_data(np.array(["y", b"x", b"z"], dtype=object))
+        assert data["labels"] == ["2020-01-02 00:00:00", "2020-01-01 00:00:00", "b'z'"]
+
     def test_with_values(self, row_ids):
         values = pd.Series(
             ["Alpha", "Beta", "Gamma", "Delta"],
@@ -156,6 +202,12 @@ class TestLabelAnnotation:
         data = ann.get_render_data(row_ids)
         assert data["labels"] == ["gene_A", "gene_B", "gene_C", "gene_D"]
 
+    def test_missing_value_falls_back_to_id(self):
+        values = pd.Series(["Alpha", "Beta"], index=["gene_A", "gene_B"])
+        ann = LabelAnnotation("names", values)
+        data = ann.get_render_data(np.array(["gene_B", "gene_X"], dtype=object))
+        assert data["labels"] == ["Beta", "gene_X"]
+
     def test_font_size(self):
         ann = LabelAnnotation("test", font_size=14.0)
         data = ann.get_render_data(np.array(["a"], dtype=object))
@@ -187,12 +239,17 @@ class TestBarChartAnnotation:
         data = ann.get_render_data(np.array(["a", "b", "c"], dtype=object))
         assert data["values"][1] == 0.0  # NaN → 0
 
+    def test_missing_id(self, numeric_series):
+        ann = BarChartAnnotation("expr", numeric_series)
+        data = ann.get_render_data(np.array(["gene_D", "missing"], dtype=object))
+        assert data["values"].tolist() == [4.5, 0.0]
+
 
 # --- SparklineAnnotation ---
 
 class TestSparklineAnnotation:
     def test_basic(self, replicate_df, row_ids):
-        ann = SparklineAnnotation("trend", replicate_df)
+        ann = SparklineAnnotation("trend", replicate_df, payload_format="list")
         assert ann.annotation_type == "sparkline"
         data = ann.get_render_data(row_ids)
         assert data["type"] == "sparkline"
@@ -200,10 +257,30 @@ class TestSparklineAnnotation:
         assert data["series"][0] == [1.0, 2.0, 3.0]
 
     def test_missing_id(self, replicate_df):
-        ann = SparklineAnnotation("trend", replicate_df)
+        ann = SparklineAnnotation("trend", replicate_df, payload_format="list")
         data = ann.get_render_data(np.array(["gene_A", "missing"], dtype=object))
         assert data["series"][1] == []
 
+    def test_duplicate_ids_use_first_row(self):
+        df = pd.DataFrame({"t1": [1.0, 9.0], "t2": [2.0, 9.0]}, index=["a", "a"])
+        ann = SparklineAnnotation("trend", df, payload_format="list")
+        data = ann.get_render_data(np.array(["a"], dtype=object))
+        assert data["series"] == [[1.0, 2.0]]
+
+    def test_binary_payload(self):
+        df = pd.DataFrame({"t1": [1.0, 2.0], "t2": [np.inf, 4.0]}, index=["a", "b"])
+        ann = SparklineAnnotation("trend", df)
+        data = ann.get_render_data(np.array(["b", "missing", "a"], dtype=object))
+        assert "series" not in data
+        series = _decode_float32(data["seriesB64"], data["seriesShape"])
+        np.testing.assert_array_equal(
+            series, [[2.0, 4.0], [np.nan, np.nan], [1.0, np.nan]]
+        )
+
+    def test_invalid_payload_format(self, replicate_df):
+        with pytest.raises(ValueError, match="payload_format"):
+            SparklineAnnotation("trend", replicate_df, payload_format="csv")
+
 
 # --- BoxPlotAnnotation ---
 
@@ -224,28 +301,119 @@ class TestBoxPlotAnnotation:
         data = ann.get_render_data(np.array(["missing"], dtype=object))
         assert data["stats"][0] is None
 
+    def test_nan_values_ignored(self):
+        df = pd.DataFrame(
+            {"rep1": [1.0, np.nan], "rep2": [np.nan, np.nan], "rep3": [5.0, np.nan]},
+            index=["a", "b"],
+        )
+        ann = BoxPlotAnnotation("dist", df)
+        data = ann.get_render_data(np.array(["a", "b"], dtype=object))
+        assert data["stats"][0] == {"min": 1.0, "q1": 2.0, "median": 3.0, "q3": 4.0, "max": 5.0}
+        assert data["stats"][1] is None  # all-NaN row
+
+    @staticmethod
+    def _row_stats(row):
+        row = row[~np.isnan(row)]
+        with np.errstate(invalid="ignore"):
+            return [
+                float(np.min(row)), float(np.percentile(row, 25)), float(np.median(row)),
+                float(np.percentile(row, 75)), float(np.max(row)),
+            ]
+
+    def test_quantiles_match_per_row_numpy(self):
+        rng = np.random.default_rng(0)
+        values = rng.normal(size=(6, 7))
+        values[::2, ::3] = np.nan
+        df = pd.DataFrame(values, index=list("abcdef"))
+        ann = BoxPlotAnnotation("dist", df)
+        data = ann.get_render_data(np.array(list("abcdef"), dtype=object))
+        for stats, row in zip(data["stats"], values):
+            assert [stats[k] for k in ("min", "q1", "median", "q3", "max")] == self._row_stats(row)
+
+    def test_infinite_values(self):
+        df = pd.DataFrame(
+            [[1.0, 3.0, np.inf], [-np.inf, 0.0, 2.0], [1.0, np.inf, np.nan]],
+            index=["a", "b", "c"],
+        )
+        ann = BoxPlotAnnotation("dist", df)
+        data = ann.get_render_data(np.array(["a", "b", "c"], dtype=object))
+        assert data["stats"][0]["median"] == 3.0
+        assert data["stats"][0]["max"] == np.inf
+        assert data["stats"][1]["min"] == -np.inf
+        assert data["stats"][1]["median"] == 0.0
+        assert data["stats"][2]["median"] == np.inf
+        for stats, row in zip(data["stats"], df.to_numpy()):
+            got = [stats[k] for k in ("min", "median", "max")]
+            expected = self._row_stats(row)
+            assert got == [expected[0], expected[2], expected[4]]
+
 
 # --- ViolinPlotAnnotation ---
 
 class TestViolinPlotAnnotation:
     def test_basic(self, replicate_df, row_ids):
-        ann = ViolinPlotAnnotation("density", replicate_df)
+        ann = ViolinPlotAnnotation("density", replicate_df, payload_format="list")
         assert ann.annotation_type == "violin"
         data = ann.get_render_data(row_ids)
         assert data["type"] == "violin"
         assert len(data["densities"]) == 4
-        # Each density should have counts and centers
+        # Each density has its counts; the bin centers are shared
         d = data["densities"][0]
         assert "counts" in d
-        assert "centers" in d
+        assert len(data["centers"]) == len(d["counts"])
+
+    def test_counts_match_histogram(self, replicate_df, row_ids):
+        ann = ViolinPlotAnnotation("density", replicate_df, n_bins=5, payload_format="list")
+        data = ann.get_render_data(row_ids)
+        counts, _ = np.histogram(replicate_df.loc["gene_B"], bins=5, range=(1.0, 12.0))
+        np.testing.assert_array_equal(data["densities"][1]["counts"], counts / counts.max())
 
     def test_single_value_returns_none(self):
         """Single-value row can't form distribution."""
         df = pd.DataFrame({"rep1": [5.0]}, index=["a"])
-        ann = ViolinPlotAnnotation("v", df)
+        ann = ViolinPlotAnnotation("v", df, payload_format="list")
         data = ann.get_render_data(np.array(["a"], dtype=object))
         assert data["densities"][0] is None
 
+    def test_binary_payload(self, replicate_df):
+        order = np.array(["gene_B", "missing"], dtype=object)
+        listed = ViolinPlotAnnotation(
+            "density", replicate_df, n_bins=5, payload_format="list"
+        ).get_render_data(order)
+        data = ViolinPlotAnnotation("density", replicate_df, n_bins=5).get_render_data(order)
+        densities = _decode_float32(data["densitiesB64"], data["densitiesShape"])
+        np.testing.assert_allclose(densities[0], listed["densities"][0]["counts"], rtol=1e-7)
+        assert np.isnan(densities[1]).all()
+        assert data["centers"] == listed["centers"]
+
+
+# --- Render data caching ---
+
+class TestRenderDataCache:
+    def test_same_order_array_reuses_result(self, replicate_df, row_ids):
+        ann = BoxPlotAnnotation("dist", replicate_df)
+        assert ann.get_render_data(row_ids) is ann.get_render_data(row_ids)
+
+    def test_new_order_array_recomputes(self, replicate_df, row_ids):
+        ann = BoxPlotAnnotation("dist", replicate_df)
+        first = ann.get_render_data(row_ids)
+        reordered = ann.get_render_data(row_ids[::-1].copy())
+        assert reordered is not first
+        assert reordered["stats"][0] == first["stats"][-1]
+
+    def test_lookup_reused_for_same_order(self, replicate_df, row_ids):
+        ann = BoxPlotAnnotation("dist", replicate_df)
+        positions = ann._lookup_positions(replicate_df.index, row_ids)
+        assert ann._lookup_positions(replicate_df.index, row_ids) is positions
+        reordered = ann._lookup_positions(replicate_df.index, row_ids[::-1].copy())
+        assert reordered.tolist() == [3, 2, 1, 0]
+
+    def test_lookup_memo_is_per_track(self, replicate_df, row_ids):
+        first = BoxPlotAnnotation("a", replicate_df)
+        second = BoxPlotAnnotation("b", replicate_df)
+        first._lookup_positions(replicate_df.index, row_ids)
+        assert second._last_lookup is None
+
 
 # --- AnnotationLayoutEngine ---
 
@@ -268,6 +436,26 @@ class TestAnnotationLayoutEngine:
         # Second track offset > first track offset + first track width
         assert specs[1].offset > specs[0].offset + specs[0].track_width
 
+    def test_render_data_follows_track_order(self, categorical_series, numeric_series, row_ids):
+        tracks = [
+            BarChartAnnotation("expr", numeric_series),
+            CategoricalAnnotation("ct", categorical_series),
+            LabelAnnotation("ids"),
+        ]
+        specs = AnnotationLayoutEngine.compute_edge_tracks(tracks, "left", row_ids)
+        assert [spec.render_data["name"] for spec in specs] == ["expr", "ct", "ids"]
+
+    def test_spec_to_dict(self, categorical_series, row_ids):
+        tracks = [CategoricalAnnotation("ct", categorical_series)]
+        spec = AnnotationLayoutEngine.compute_edge_tracks(tracks, "top", row_ids)[0]
+        assert spec.to_dict() == {
+            "name": "ct",
+            "edge": "top",
+            "offset": spec.offset,
+            "trackWidth": spec.track_width,
+            "renderData": spec.render_data,
+        }
+
     def test_total_edge_width_empty(self):
         assert AnnotationLayoutEngine.total_edge_width([]) == 0.0
 
@@ -317,6 +505,18 @@ class TestLabelLayoutEngine:
         with pytest.raises(ValueError, match="Unknown label mode"):
             LabelLayoutEngine.compute(row_ids, cell_layout_4, mode="invalid")
 
+    @pytest.mark.parametrize("mode", ["all", "auto", "none"])
+    def test_compute_serialized_matches_serialize(self, mode):
+        ids = np.array([f"g{i}" for i in range(20)] + [7], dtype=object)
+        layout = CellLayout(n_cells=21, cell_size=4.0, gap_positions={10}, gap_size=6.0)
+        expected = LabelLayoutEngine.serialize(
+            LabelLayoutEngine.compute(ids, layout, mode=mode, font_size=12.0),
+            font_size=12.0,
+        )
+        got = LabelLayoutEngine.compute_serialized(ids, layout, mode=mode, font_size=12.0)
+        assert got == expected
+        assert all(type(d["position"]) is float for d in got)
+
 
 # --- Heatmap API integration ---
 
@@ -398,6 +598,32 @@ class TestHeatmapAnnotationAPI:
         data = hm._build_label_data()
         assert data is None
 
+    def test_panel_data_reused_until_inputs_change(self, small_matrix_df, small_row_metadata):
+        from dream_heatmap.api import Heatmap
+        hm = Heatmap(small_matrix_df)
+        hm.add_annotation("left", CategoricalAnnotation("cell_type", small_row_metadata["cell_type"]))
+        hm._compute_layout()
+        ann, labels = hm._build_annotation_data(), hm._build_label_data()
+        assert hm._build_annotation_data() is ann
+        assert hm._build_label_data() is labels
+
+        hm.add_annotation("right", CategoricalAnnotation("batch", small_row_metadata["cell_type"]))
+        assert set(hm._build_annotation_data()) == {"left", "right"}
+        hm.set_label_display(rows="none", cols="none")
+        assert hm._build_label_data() is None
+
+    def test_build_panels_matches_builders(self, small_matrix_df, small_row_metadata):
+        from dream_heatmap.api import Heatmap
+        hm = Heatmap(small_matrix_df)
+        hm.add_annotation("left", CategoricalAnnotation("cell_type", small_row_metadata["cell_type"]))
+        hm.cluster_rows()
+        hm._compute_layout()
+        dendro, ann, labels, legends = hm._build_panels()
+        assert dendro == hm._build_dendrogram_data()
+        assert ann is hm._build_annotation_data()
+        assert labels is hm._build_label_data()
+        assert legends is hm._build_legend_data()
+
     def test_layout_accounts_for_annotations(self, small_matrix_df, small_row_metadata):
         """Layout should allocate space for annotation tracks."""
         from dream_heatmap.api import Heatmap
@@ -414,6 +640,17 @@ class TestHeatmapAnnotationAPI:
         # Heatmap should shift right to make room for left annotation
         assert ann_x > plain_x
 
+    def test_annotation_extents_track_edges(self, small_matrix_df, small_row_metadata):
+        from dream_heatmap.api import Heatmap
+        hm = Heatmap(small_matrix_df)
+        assert set(hm._annotation_extents.values()) == {0.0}
+        hm.add_annotation("left", CategoricalAnnotation("a", small_row_metadata["cell_type"]))
+        hm.add_annotation("left", CategoricalAnnotation("b", small_row_metadata["cell_type"]))
+        assert hm._annotation_extents["left_annotation_width"] == (
+            AnnotationLayoutEngine.total_edge_width(hm._annotations["left"])
+        )
+        assert hm._annotation_extents["right_annotation_width"] == 0.0
+
 
 # --- Package exports ---
 
@@ -51,6 +51,16 @@ class TestClusterEngineBasic:
         result = ClusterEngine.cluster(data, ids)
         assert list(result.leaf_order) == ["only"]
         assert len(result.dendrogram_nodes) == 0
+        assert result.linkage_matrix.shape == (0, 4)
+        assert result.ids is not ids
+
+    def test_unclustered_shares_ids_and_linkage(self):
+        ids = np.array(["only"], dtype=object)
+        a = ClusterResult.unclustered(ids)
+        b = ClusterResult.unclustered(ids)
+        assert a.leaf_order is ids and a.ids is ids
+        assert a.linkage_matrix is b.linkage_matrix
+        assert not a.linkage_matrix.flags.writeable
 
     def test_two_items(self):
         data = np.array([[1.0, 2.0], [3.0, 4.0]])
@@ -99,6 +109,31 @@ class TestClusterEngineMetrics:
         with pytest.raises(ValueError, match="Unknown distance"):
             ClusterEngine.cluster(data, ids, metric="invalid")
 
+    @pytest.mark.parametrize("method", sorted(ClusterEngine.VALID_METHODS))
+    @pytest.mark.parametrize("metric", ["euclidean", "correlation", "cityblock"])
+    def test_pair_linkage_matches_scipy(self, method, metric):
+        from scipy.cluster.hierarchy import linkage
+        from scipy.spatial.distance import pdist
+
+        data = np.random.default_rng(7).standard_normal((2, 5))
+        result = ClusterEngine.cluster(data, np.array(["a", "b"]), method=method, metric=metric)
+        if method == "ward" and metric == "correlation":
+            metric = "euclidean"
+        expected = linkage(pdist(data, metric=metric), method=method, optimal_ordering=True)
+        np.testing.assert_array_equal(result.linkage_matrix, expected)
+
+    @pytest.mark.parametrize("method", ["average", "ward"])
+    def test_fastcluster_matches_scipy(self, method):
+        pytest.importorskip("fastcluster")
+        from scipy.cluster.hierarchy import linkage
+        from scipy.spatial.distance import pdist
+
+        data = np.random.default_rng(42).standard_normal((20, 5))
+        ids = np.array([f"r{i}" for i in range(20)])
+        result = ClusterEngine.cluster(data, ids, method=method, optimal_ordering=False)
+        expected = linkage(pdist(data), method=method)
+        np.testing.assert_allclose(result.linkage_matrix[:, 2], expected[:, 2])
+
 
 class TestClusterEngineNaN:
     def test_handles_nan(self):
@@ -247,6 +282,28 @@ class TestClusterAPI:
         # Each group should have a cluster result
         assert len(hm._row_cluster) == 3  # T-cell, B-cell, NK-cell
 
+    @pytest.mark.parametrize("min_cells", [0, 10**9])
+    def test_split_groups_clustered_independently(self, large_matrix_df, monkeypatch, min_cells):
+        """Each group's leaf order matches clustering that group alone."""
+        from dream_heatmap import api
+        from dream_heatmap.api import Heatmap
+
+        # 0 forces the thread pool, 10**9 the sequential path
+        monkeypatch.setattr(api, "_PARALLEL_CLUSTER_MIN_CELLS", min_cells)
+        ids = large_matrix_df.index.to_numpy(dtype=object)
+        assignments = {"a": ids[:40].tolist(), "b": ids[40:75].tolist(), "c": ids[75:].tolist()}
+        hm = Heatmap(large_matrix_df)
+        hm.split_rows(assignments=assignments)
+        hm.cluster_rows()
+
+        assert list(hm._row_cluster) == ["a", "b", "c"]
+        for group in hm._row_mapper.groups:
+            member_ids = np.array(assignments[group.name], dtype=object)
+            expected = ClusterEngine.cluster(
+                large_matrix_df.loc[member_ids].to_numpy(), member_ids
+            )
+            np.testing.assert_array_equal(group.ids, expected.leaf_order)
+
     def test_cluster_layout_has_dendro_space(self, small_matrix_df):
         from dream_heatmap.api import Heatmap
 
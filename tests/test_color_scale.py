@@ -42,6 +42,38 @@ class TestColorScaleLUT:
         # The LUTs should be different
         assert not np.array_equal(cs1.lut, cs2.lut)
 
+    def test_lut_shared_per_cmap(self):
+        import matplotlib.pyplot as plt
+
+        cs1 = ColorScale("plasma", vmin=0, vmax=1)
+        cs2 = ColorScale("plasma", vmin=-5, vmax=5)
+        assert cs1.lut is cs2.lut
+        expected = (plt.get_cmap("plasma")(np.linspace(0, 1, 256)) * 255).astype(np.uint8)
+        np.testing.assert_array_equal(cs1.lut, expected)
+
+
+class TestColorScaleBuiltinLUTs:
+    def test_builtin_luts_match_matplotlib(self):
+        from matplotlib import colormaps
+        from dream_heatmap.core.color_scale import _builtin_luts
+
+        luts = _builtin_luts()
+        assert "viridis" in luts
+        for name, lut in luts.items():
+            expected = (colormaps[name](np.linspace(0, 1, 256)) * 255).astype(np.uint8)
+            np.testing.assert_array_equal(lut, expected)
+
+    def test_builtin_cmap_skips_matplotlib(self):
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "from dream_heatmap.core.color_scale import ColorScale\n"
+            "ColorScale('viridis', vmin=0, vmax=1).to_bytes()\n"
+            "assert 'matplotlib' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
 
 class TestColorScaleToBytes:
     def test_bytes_length(self):
@@ -55,6 +87,11 @@ class TestColorScaleToBytes:
         restored = np.frombuffer(b, dtype=np.uint8).reshape(256, 4)
         np.testing.assert_array_equal(restored, cs.lut)
 
+    def test_bytes_cached(self):
+        cs = ColorScale()
+        assert cs.to_bytes() is cs.to_bytes()
+        assert not cs.lut.flags.writeable
+
 
 class TestColorScaleValueToIndex:
     def test_min_maps_to_0(self):
@@ -82,6 +119,53 @@ class TestColorScaleValueToIndex:
         cs = ColorScale("viridis", vmin=5, vmax=5)
         assert cs.value_to_index(5) == 127
 
+    def test_nan_maps_to_255(self):
+        cs = ColorScale("viridis", vmin=0, vmax=100)
+        assert cs.value_to_index(float("nan")) == 255
+
+    def test_returns_int(self):
+        cs = ColorScale("viridis", vmin=0, vmax=100)
+        assert type(cs.value_to_index(50)) is int
+
+
+class TestColorScaleValuesToRGBA:
+    def test_gathers_lut_rows(self):
+        cs = ColorScale("viridis", vmin=0, vmax=10)
+        values = np.linspace(-1, 11, 12).reshape(3, 4)
+        rgba = cs.values_to_rgba(values)
+        assert rgba.shape == (3, 4, 4)
+        assert rgba.dtype == np.uint8
+        assert rgba.flags.c_contiguous
+        expected = [cs.lut[cs.value_to_index(v)] for v in values.ravel()]
+        np.testing.assert_array_equal(rgba.reshape(-1, 4), expected)
+
+    def test_matches_scalar_mapping(self):
+        cs = ColorScale("viridis", vmin=-3.3, vmax=7.1)
+        values = np.concatenate([
+            np.random.default_rng(0).uniform(-10, 15, 500),
+            np.linspace(-3.3, 7.1, 101),
+            [np.inf, -np.inf],
+        ])
+        expected = [cs.lut[cs.value_to_index(v)] for v in values]
+        np.testing.assert_array_equal(cs.values_to_rgba(values), expected)
+
+    def test_equal_vmin_vmax(self):
+        cs = ColorScale("viridis", vmin=5, vmax=5)
+        rgba = cs.values_to_rgba(np.array([1.0, 5.0, 9.0]))
+        assert (rgba == cs.lut[127]).all()
+
+    def test_nan_uses_nan_color(self):
+        cs = ColorScale("viridis", vmin=0, vmax=1, nan_color=(1, 2, 3, 4))
+        rgba = cs.values_to_rgba(np.array([np.nan, 0.0]))
+        assert tuple(rgba[0]) == (1, 2, 3, 4)
+        assert tuple(rgba[1]) == tuple(cs.lut[0])
+
+    def test_does_not_modify_lut(self):
+        cs = ColorScale("viridis", vmin=0, vmax=1, nan_color=(1, 2, 3, 4))
+        lut = cs.lut.copy()
+        cs.values_to_rgba(np.array([np.nan]))
+        np.testing.assert_array_equal(cs.lut, lut)
+
 
 class TestColorScaleNanColor:
     def test_default_nan_color(self):
@@ -93,6 +93,21 @@ class TestCompositeIDMapper:
         result = comp.resolve_range(5, 10)
         assert result == {}
 
+    def test_resolve_range_matches_full_scan(self):
+        sizes = [3, 1, 4, 2, 5]
+        mappers, ids = [], []
+        for p, size in enumerate(sizes):
+            panel_ids = [f"p{p}_{i}" for i in range(size)]
+            mappers.append(IDMapper.from_ids(panel_ids))
+            ids.extend((p, x) for x in panel_ids)
+        comp = CompositeIDMapper(mappers, "horizontal")
+        for start in range(-1, len(ids) + 2):
+            for end in range(start, len(ids) + 3):
+                expected: dict[int, list] = {}
+                for p, x in ids[max(0, start):max(0, end)]:
+                    expected.setdefault(p, []).append(x)
+                assert comp.resolve_range(start, end) == expected
+
     def test_panel_gap_positions(self):
         m1 = IDMapper.from_ids(["a", "b"])
         m2 = IDMapper.from_ids(["c", "d"])
@@ -181,6 +196,20 @@ class TestHeatmapList:
         with pytest.raises(ValueError, match="same row IDs"):
             HeatmapList([hm1, hm2], direction="horizontal")
 
+    def test_hconcat_rows_in_different_order(self, shared_rows_df1):
+        from dream_heatmap.api import Heatmap
+        hm1 = Heatmap(shared_rows_df1)
+        hm2 = Heatmap(shared_rows_df1.iloc[::-1])
+        hl = HeatmapList([hm1, hm2], direction="horizontal")
+        assert len(hl.heatmaps) == 2
+
+    def test_hconcat_fewer_rows(self, shared_rows_df1):
+        from dream_heatmap.api import Heatmap
+        hm1 = Heatmap(shared_rows_df1)
+        hm2 = Heatmap(shared_rows_df1.iloc[:-1])
+        with pytest.raises(ValueError, match="same row IDs"):
+            HeatmapList([hm1, hm2], direction="horizontal")
+
     def test_vconcat_mismatched_cols(self, shared_cols_df1):
         from dream_heatmap.api import Heatmap
         df_bad = pd.DataFrame(
@@ -240,3 +269,9 @@ class TestHeatmapConcatAPI:
         result = Heatmap.vconcat(hm1, hm2)
         assert isinstance(result, HeatmapList)
         assert result.direction == "vertical"
+
+    def test_lazy_module_attributes(self):
+        from dream_heatmap import api
+        assert api.HeatmapList is HeatmapList
+        with pytest.raises(AttributeError):
+            api.NoSuchName
@@ -39,6 +39,55 @@ class TestIDMapperOriginalIds:
         mapper = IDMapper.from_ids(["gene_A", "gene_B", "gene_C"])
         assert mapper.original_ids == {"gene_A", "gene_B", "gene_C"}
 
+    def test_original_ids_cached_and_carried(self):
+        mapper = IDMapper.from_ids(["a", "b", "c", "d"])
+        ids = mapper.original_ids
+        assert isinstance(ids, frozenset)
+        assert mapper.original_ids is ids
+        reordered = mapper.apply_reorder(np.array(["d", "c", "b", "a"], dtype=object))
+        split = reordered.apply_splits({"g1": ["a", "b"], "g2": ["c", "d"]})
+        assert reordered.original_ids is ids
+        assert split.original_ids is ids
+        assert split.groups[0].id_set == {"a", "b"}
+
+    def test_from_ids_reuses_uniqueness_set(self):
+        mapper = IDMapper.from_ids(["a", "b", "c"])
+        assert "original_ids" in mapper.__dict__
+        assert mapper.groups[0].id_set is mapper.original_ids
+        assert mapper.original_ids == {"a", "b", "c"}
+
+
+class TestIDMapperMaxLabelLength:
+    def test_longest_id_as_str(self):
+        mapper = IDMapper.from_ids(["a", "gene_long", 12345])
+        assert mapper.max_label_length == 9
+
+    def test_carried_through_reorder_and_splits(self):
+        mapper = IDMapper.from_ids(["a", "bbb", "cc", "dddd"])
+        assert mapper.max_label_length == 4
+        reordered = mapper.apply_reorder(np.array(["dddd", "cc", "bbb", "a"], dtype=object))
+        split = reordered.apply_splits({"g1": ["a", "bbb"], "g2": ["cc", "dddd"]})
+        within = split.apply_reorder_within_groups({"g1": np.array(["bbb", "a"])})
+        for derived in (reordered, split, within):
+            assert derived.__dict__["max_label_length"] == 4
+
+    def test_id_strings(self):
+        mapper = IDMapper.from_ids(["a", 12, "ccc"])
+        assert mapper.id_strings == ("a", "12", "ccc")
+        assert mapper.id_strings is mapper.id_strings
+
+    def test_zoom_slices_id_strings(self):
+        mapper = IDMapper.from_ids(["a", "bbb", "cc", "dddd"])
+        mapper.id_strings
+        zoomed = mapper.apply_zoom(1, 3)
+        assert zoomed.__dict__["id_strings"] == ("bbb", "cc")
+        assert zoomed.max_label_length == 3
+
+    def test_zoom_recomputes(self):
+        mapper = IDMapper.from_ids(["a", "bbb", "cc", "dddd"])
+        assert mapper.max_label_length == 4
+        assert mapper.apply_zoom(0, 3).max_label_length == 3
+
 
 class TestIDMapperVisualIndex:
     def test_visual_index_of_existing(self):
@@ -47,6 +96,13 @@ class TestIDMapperVisualIndex:
         assert mapper.visual_index_of("b") == 1
         assert mapper.visual_index_of("c") == 2
 
+    def test_visual_index_of_after_reorder(self):
+        mapper = IDMapper.from_ids(["a", "b", "c"])
+        mapper.visual_index_of("a")
+        reordered = mapper.apply_reorder(np.array(["c", "a", "b"], dtype=object))
+        assert reordered.visual_index_of("a") == 1
+        assert mapper.visual_index_of("a") == 0
+
     def test_visual_index_of_missing(self):
         mapper = IDMapper.from_ids(["a", "b", "c"])
         assert mapper.visual_index_of("z") is None
@@ -148,6 +204,23 @@ class TestIDMapperSplits:
         # Within group1, "a" comes before "c" in original order
         assert list(split.visual_order) == ["a", "c", "b", "d"]
 
+    def test_split_accepts_array_assignments(self):
+        mapper = IDMapper.from_ids([3, 1, 2, 0])
+        split = mapper.apply_splits({
+            "even": np.array([0, 2]),
+            "odd": np.array([1, 3]),
+        })
+        assert split.visual_order.tolist() == [2, 0, 3, 1]
+        assert [g.ids.tolist() for g in split.groups] == [[2, 0], [3, 1]]
+        assert split.visual_index_of(3) == 2
+
+    def test_group_offsets(self):
+        mapper = IDMapper.from_ids(["a", "b", "c", "d", "e", "f"])
+        split = mapper.apply_splits({"g1": ["a"], "g2": ["b", "c", "d"], "g3": ["e", "f"]})
+        assert split.group_offsets.tolist() == [0, 1, 4]
+        assert not split.group_offsets.flags.writeable
+        assert mapper.group_offsets.tolist() == [0]
+
     def test_split_missing_ids_raises(self):
         mapper = IDMapper.from_ids(["a", "b", "c"])
         with pytest.raises(ValueError, match="don't match"):
@@ -158,6 +231,11 @@ class TestIDMapperSplits:
         with pytest.raises(ValueError, match="don't match"):
             mapper.apply_splits({"g1": ["a", "b", "c"]})
 
+    def test_split_swapped_id_raises(self):
+        mapper = IDMapper.from_ids(["a", "b", "c"])
+        with pytest.raises(ValueError, match="missing: \\['c'\\], extra: \\['z'\\]"):
+            mapper.apply_splits({"g1": ["a"], "g2": ["b", "z"]})
+
     def test_split_duplicate_ids_raises(self):
         mapper = IDMapper.from_ids(["a", "b", "c"])
         with pytest.raises(ValueError, match="multiple"):
@@ -348,6 +348,14 @@ class TestEdgeCases:
         assert isinstance(hm, Heatmap)
         assert_mapper_invariants(hm._row_mapper, {"g1", "g2", "g3", "g4"})
 
+    def test_all_slots_initialized(self):
+        """Heatmap uses __slots__; __init__ must set every slot."""
+        df = pd.DataFrame([[1.0, 2.0], [3.0, 4.0]], index=["g1", "g2"], columns=["s1", "s2"])
+        hm = Heatmap(df)
+        assert not hasattr(hm, "__dict__")
+        for name in Heatmap.__slots__:
+            getattr(hm, name)
+
 
 class TestDendrogramSide:
     """Test dendrogram side placement via set_dendro_side()."""
@@ -295,6 +295,44 @@ class TestLayoutComposer:
         assert d["colDendroSide"] == "bottom"
 
 
+class TestDendrogramLayout:
+    def test_links_in_pixel_space(self):
+        import numpy as np
+        from dream_heatmap.layout.dendrogram_layout import DendrogramLayout
+        from dream_heatmap.transform.cluster import ClusterEngine
+
+        data = np.random.default_rng(3).standard_normal((6, 4))
+        result = ClusterEngine.cluster(data, np.array([f"r{i}" for i in range(6)]))
+        cells = CellLayout(8, 10.0, frozenset({2}), 2.0)
+        spec = DendrogramLayout.compute(result, cells, dendro_height=50.0, group_offset=2)
+
+        nodes = result.dendrogram_nodes
+        max_height = max(n.height for n in nodes)
+        links = spec.to_dict()["links"]
+        assert len(links) == len(nodes) == 5
+        for node, link in zip(nodes, links):
+            for pos, key in ((node.left, "leafLeft"), (node.right, "leafRight")):
+                idx = min(2 + int(round(pos)), 7)
+                assert link[key] == cells.positions[idx] + 5.0
+            assert link["heightMerge"] == node.height / max_height * 50.0
+            assert link["memberIds"] == list(node.member_ids)
+        assert [link.to_dict() for link in spec.links] == links
+
+    def test_spec_equality_and_from_links(self):
+        import numpy as np
+        from dream_heatmap.layout.dendrogram_layout import DendrogramLayout, DendrogramSpec
+        from dream_heatmap.transform.cluster import ClusterEngine
+
+        data = np.random.default_rng(4).standard_normal((5, 3))
+        result = ClusterEngine.cluster(data, np.array([f"r{i}" for i in range(5)]))
+        spec = DendrogramLayout.compute(result, CellLayout(5, 10.0, frozenset(), 0.0))
+
+        rebuilt = DendrogramSpec.from_links(spec.links, spec.side, spec.offset, spec.extent)
+        assert rebuilt == spec
+        assert rebuilt.to_dict() == spec.to_dict()
+        moved = DendrogramSpec.from_links(spec.links, spec.side, 5.0, spec.extent)
+        assert moved != spec
+
 class TestLegendPanelClipping:
     def test_total_height_includes_legend_panel(self):
         """total_height must be >= legend panel bottom."""
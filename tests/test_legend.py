@@ -53,6 +53,11 @@ class TestBuildLegendData:
         legends = hm._build_legend_data()
         assert len(legends) == 1
 
+    def test_colors_key_matches_colors(self, row_series):
+        ann = CategoricalAnnotation("Cell Type", row_series)
+        assert ann.colors_key == frozenset(ann.colors.items())
+        assert ann.colors_key is ann.colors_key
+
     def test_different_annotations(self, matrix_df, row_series, col_series):
         """Two different categorical annotations → two legends."""
         hm = Heatmap(matrix_df)
@@ -203,6 +208,15 @@ class TestEstimateLegendDimensions:
 
         assert h_title > h_no
 
+    def test_recomputed_after_inputs_change(self, matrix_df, row_series):
+        hm = Heatmap(matrix_df)
+        _, h_empty = hm._estimate_legend_dimensions()
+        hm.add_annotation("left", CategoricalAnnotation("cell_type", row_series))
+        _, h_legend = hm._estimate_legend_dimensions()
+        hm.set_value_description("Expression")
+        _, h_title = hm._estimate_legend_dimensions()
+        assert h_empty < h_legend < h_title
+
 
 class TestLayoutWithLegends:
     def test_legend_panel_in_layout(self, matrix_df, row_series):
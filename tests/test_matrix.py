@@ -35,6 +35,14 @@ class TestMatrixDataInit:
         m = MatrixData(small_matrix_df)
         assert m.values.flags["C_CONTIGUOUS"]
 
+    def test_id_indexes_cached(self, small_matrix_df):
+        m = MatrixData(small_matrix_df)
+        assert m.row_index.tolist() == m.row_ids.tolist()
+        assert m.col_index.tolist() == m.col_ids.tolist()
+        assert m.row_index is m.row_index
+        sub = m.slice(m.row_ids[:2], m.col_ids)
+        assert sub.row_index.tolist() == m.row_ids[:2].tolist()
+
 
 class TestMatrixDataValidation:
     def test_rejects_non_dataframe(self):
@@ -71,6 +79,18 @@ class TestMatrixDataValidation:
         with pytest.raises(TypeError, match="numeric"):
             MatrixData(df)
 
+    def test_numeric_check_matches_select_dtypes(self):
+        df = pd.DataFrame({
+            "f": [1.0, 2.0],
+            "i": pd.array([1, 2], dtype="Int64"),
+            "flag": [True, False],
+            "f2": [3.0, 4.0],
+            "cat": pd.Categorical(["x", "y"]),
+        })
+        with pytest.raises(TypeError, match=r"Non-numeric columns: \['flag', 'cat'\]"):
+            MatrixData(df)
+        assert MatrixData(df[["f", "i", "f2"]]).shape == (2, 3)
+
 
 class TestMatrixDataSerialization:
     def test_to_bytes_length(self, small_matrix_df):
@@ -84,6 +104,23 @@ class TestMatrixDataSerialization:
         restored = np.frombuffer(b, dtype=np.float64).reshape(4, 3)
         np.testing.assert_array_equal(restored, m.values)
 
+    def test_to_bytes_float32(self, nan_matrix_df):
+        m = MatrixData(nan_matrix_df)
+        restored = np.frombuffer(m.to_bytes("float32"), dtype=np.float32)
+        np.testing.assert_array_equal(restored, m.values.astype(np.float32).ravel())
+
+    def test_to_bytes_rejects_unknown_dtype(self, small_matrix_df):
+        m = MatrixData(small_matrix_df)
+        with pytest.raises(ValueError, match="Unsupported matrix dtype"):
+            m.to_bytes("uint8")
+
+    def test_as_memoryview_is_zero_copy(self, small_matrix_df):
+        m = MatrixData(small_matrix_df)
+        view = m.as_memoryview()
+        assert view.readonly
+        assert view.tobytes() == m.to_bytes()
+        assert np.shares_memory(np.asarray(view), m.values)
+
 
 class TestMatrixDataRange:
     def test_finite_range(self, small_matrix_df):
@@ -106,3 +143,12 @@ class TestMatrixDataRange:
         )
         m = MatrixData(df)
         assert m.finite_range() == (0.0, 1.0)
+
+    def test_finite_range_ignores_infinities(self):
+        df = pd.DataFrame(
+            [[np.inf, 2.0, np.nan], [-3.0, -np.inf, 5.0]],
+            index=["r1", "r2"],
+            columns=["c1", "c2", "c3"],
+        )
+        m = MatrixData(df)
+        assert m.finite_range() == (-3.0, 5.0)
@@ -21,6 +21,12 @@ class TestMetadataFrameInit:
         assert list(mf.df.index) == ["gene_A", "gene_B", "gene_C", "gene_D"]
         assert list(mf.df["group"]) == ["A", "B", "C", "D"]
 
+    def test_aligned_metadata_not_modified(self, small_matrix_df, small_row_metadata):
+        original = small_row_metadata.copy()
+        mf = MetadataFrame(small_row_metadata, small_matrix_df.index, "row")
+        pd.testing.assert_frame_equal(mf.df, original)
+        assert mf.df is not small_row_metadata
+
 
 class TestMetadataFrameValidation:
     def test_rejects_non_dataframe(self, small_matrix_df):
@@ -69,3 +75,19 @@ class TestMetadataFrameAccess:
         cats = mf.get_categories("cell_type")
         assert set(cats.keys()) == {"T-cell", "B-cell", "NK-cell"}
         assert set(cats["T-cell"]) == {"gene_A", "gene_C"}
+
+    @pytest.mark.parametrize("values", [
+        ["b", None, "a", "b"],
+        [1.5, float("nan"), -0.0, 0.0],
+        pd.array([2, None, 1, 2], dtype="Int64"),
+        pd.Categorical(["y", "x", None, "y"]),
+    ])
+    def test_get_categories_matches_str_of_values(self, values):
+        ids = pd.Index(["r1", "r2", "r3", "r4"])
+        mf = MetadataFrame(pd.DataFrame({"c": values}, index=ids), ids, "row")
+        expected: dict[str, list] = {}
+        for idx, val in mf.get_column("c").items():
+            expected.setdefault(str(val), []).append(idx)
+        cats = mf.get_categories("c")
+        assert cats == expected
+        assert list(cats) == list(expected)
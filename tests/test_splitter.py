@@ -130,6 +130,25 @@ class TestSplitAPI:
         # All IDs still present
         assert hm._row_mapper.original_ids == set(small_matrix_df.index)
 
+    def test_hierarchical_gap_sizes(self, small_matrix_df):
+        from dream_heatmap.api import Heatmap
+        from dream_heatmap.core.id_mapper import SplitGroup
+
+        groups = tuple(
+            SplitGroup(name=name, ids=np.arange(size))
+            for name, size in [("a|x", 2), ("a|y", 1), ("b|x", 3), ("c", 1)]
+        )
+        mapper = IDMapper(visual_order=np.arange(7).astype(object), groups=groups)
+        gaps = Heatmap(small_matrix_df)._compute_gap_sizes(mapper)
+        assert gaps == {
+            2: Heatmap.SECONDARY_GAP_PX,
+            3: Heatmap.PRIMARY_GAP_PX,
+            6: Heatmap.PRIMARY_GAP_PX,
+        }
+
+        flat = mapper.apply_splits({"a": [0, 1, 2], "b": [3, 4, 5, 6]})
+        assert Heatmap(small_matrix_df)._compute_gap_sizes(flat) is None
+
     def test_split_rows_by_assignments(self, small_matrix_df):
         from dream_heatmap.api import Heatmap
 
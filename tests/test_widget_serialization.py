@@ -1,5 +1,6 @@
 """Tests for widget serializers."""
 
+import base64
 import json
 
 import numpy as np
@@ -12,6 +13,7 @@ from dream_heatmap.core.id_mapper import IDMapper
 from dream_heatmap.layout.composer import LayoutComposer
 from dream_heatmap.widget.serializers import (
     serialize_matrix,
+    serialize_matrix_b64,
     serialize_color_lut,
     serialize_layout,
     serialize_id_mappers,
@@ -27,6 +29,19 @@ class TestSerializeMatrix:
         restored = np.frombuffer(b, dtype=np.float64).reshape(m.shape)
         np.testing.assert_array_equal(restored, m.values)
 
+    def test_float32_roundtrip(self, small_matrix_df):
+        m = MatrixData(small_matrix_df)
+        b = serialize_matrix(m, "float32")
+        assert len(b) == m.values.size * 4
+        restored = np.frombuffer(b, dtype=np.float32).reshape(m.shape)
+        np.testing.assert_array_equal(restored, m.values.astype(np.float32))
+
+    @pytest.mark.parametrize("dtype", ["float64", "float32"])
+    def test_b64_matches_bytes(self, small_matrix_df, dtype):
+        m = MatrixData(small_matrix_df)
+        b64 = serialize_matrix_b64(m, dtype)
+        assert base64.b64decode(b64) == serialize_matrix(m, dtype)
+
 
 class TestSerializeColorLUT:
     def test_length(self):
@@ -94,6 +109,14 @@ class TestSerializeConfig:
         d = json.loads(s)
         assert d["cmapName"] == "plasma"
 
+    def test_numpy_values(self):
+        s = serialize_config(
+            vmin=0.0, vmax=1.0, nan_color=(0, 0, 0, 255),
+            annotations={"values": np.array([0.5, 1.0]), "n": np.int64(2)},
+        )
+        d = json.loads(s)
+        assert d["annotations"] == {"values": [0.5, 1.0], "n": 2}
+
 
 class TestSelectionState:
     def test_initial_empty(self):
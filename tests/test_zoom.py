@@ -130,6 +130,147 @@ class TestHeatmapZoom:
         assert reset_layout.title_y > 0
         assert reset_layout.title_y == original_title_y
 
+    def test_duplicate_zoom_events_skipped(self, small_matrix_df):
+        from dream_heatmap.api import Heatmap
+
+        class FakeWidget:
+            def __init__(self):
+                self.updates = []
+
+            def update_data(self, matrix, *args, **kwargs):
+                self.updates.append(matrix.shape)
+
+        hm = Heatmap(small_matrix_df)
+        hm._compute_layout()
+        hm._widget = FakeWidget()
+        zoom_range = {
+            "row_start": 0, "row_end": 2,
+            "col_start": 0, "col_end": 2,
+        }
+        hm._handle_zoom(zoom_range)
+        hm._handle_zoom(dict(zoom_range))
+        assert hm._widget.updates == [(2, 2)]
+
+        # A reset after a zoom is applied once; the repeat is skipped
+        hm._handle_zoom(None)
+        hm._handle_zoom(None)
+        hm._handle_zoom(zoom_range)
+        assert hm._widget.updates == [(2, 2), (4, 3), (2, 2)]
+
+    def test_same_zoom_reapplied_after_state_change(self, small_matrix_df):
+        from dream_heatmap.api import Heatmap
+
+        class FakeWidget:
+            def __init__(self):
+                self.labels = []
+
+            def update_data(self, matrix, *args, **kwargs):
+                self.labels.append(kwargs["labels"])
+
+        hm = Heatmap(small_matrix_df)
+        hm._compute_layout()
+        hm._widget = FakeWidget()
+        zoom_range = {
+            "row_start": 0, "row_end": 2,
+            "col_start": 0, "col_end": 2,
+        }
+        hm._handle_zoom(zoom_range)
+        hm.set_label_display(rows="none", cols="none")
+        hm._handle_zoom(zoom_range)
+        assert len(hm._widget.labels) == 2
+        assert hm._widget.labels[0] != hm._widget.labels[1]
+
+        # State set directly (as the dashboard does) also counts
+        hm._show_row_dendro = False
+        hm._handle_zoom(zoom_range)
+        assert len(hm._widget.labels) == 3
+
+    def test_reset_reuses_full_view(self, small_matrix_df):
+        from dream_heatmap.api import Heatmap
+
+        class FakeWidget:
+            def update_data(self, matrix, color_scale, row_mapper, col_mapper, layout, **kwargs):
+                self.layout = layout
+                self.labels = kwargs["labels"]
+                self.dendrograms = kwargs["dendrograms"]
+
+        hm = Heatmap(small_matrix_df)
+        hm.set_label_display(rows="all", cols="all")
+        hm._compute_layout()
+        labels = hm._build_label_data()
+        hm._widget = FakeWidget()
+        dendrograms = {"row": {"links": []}}
+        layout = hm._layout
+        hm._base_panels = (
+            hm._view_settings(), hm._view_objects(),
+            (layout, dendrograms, None, labels),
+        )
+
+        hm._handle_zoom({"row_start": 0, "row_end": 2, "col_start": 0, "col_end": 2})
+        assert hm._widget.layout is not layout
+        hm._handle_zoom(None)
+        assert hm._widget.layout is layout
+        assert hm._widget.labels is labels
+        assert hm._widget.dendrograms is dendrograms
+
+    def test_reset_rebuilds_for_new_mapper(self, small_matrix_df):
+        from dream_heatmap.api import Heatmap
+
+        class FakeWidget:
+            def update_data(self, matrix, color_scale, row_mapper, col_mapper, layout, **kwargs):
+                self.row_mapper = row_mapper
+                self.layout = layout
+
+        hm = Heatmap(small_matrix_df)
+        hm._compute_layout()
+        old_layout = hm._layout
+        hm._base_panels = (
+            hm._view_settings(), hm._view_objects(), (old_layout, None, None, None),
+        )
+        hm._widget = FakeWidget()
+
+        hm._handle_zoom({"row_start": 0, "row_end": 2, "col_start": 0, "col_end": 2})
+        hm._row_mapper = hm._row_mapper.apply_reorder(
+            hm._row_mapper.visual_order[::-1].copy()
+        )
+        hm._handle_zoom(None)
+        assert hm._widget.row_mapper is hm._row_mapper
+        assert hm._widget.layout is not old_layout
+        assert hm._widget.layout is hm._layout
+
+    def test_reset_after_cluster_shows_dendrogram(self, small_matrix_df):
+        from dream_heatmap.api import Heatmap
+
+        class FakeWidget:
+            def update_data(self, matrix, color_scale, row_mapper, col_mapper, layout, **kwargs):
+                self.row_mapper = row_mapper
+                self.layout = layout
+                self.dendrograms = kwargs["dendrograms"]
+
+        hm = Heatmap(small_matrix_df)
+        shown_layout = hm._full_view()[0]
+        hm._widget = FakeWidget()
+
+        hm._handle_zoom({"row_start": 0, "row_end": 2, "col_start": 0, "col_end": 2})
+        hm.cluster_rows()
+        hm._handle_zoom(None)
+        assert hm._widget.row_mapper is hm._row_mapper
+        assert hm._widget.layout is not shown_layout
+        assert hm._widget.layout.row_dendro_width > 0
+        assert "row" in hm._widget.dendrograms
+
+    def test_mutator_invalidates_full_view(self, small_matrix_df):
+        from dream_heatmap.api import Heatmap
+
+        hm = Heatmap(small_matrix_df)
+        view = hm._full_view()
+        assert hm._full_view() is view
+        hm.set_title("Title")
+        assert hm._full_view() is not view
+        view = hm._full_view()
+        hm._show_row_dendro = False
+        assert hm._full_view() is not view
+
 
 # --- MatrixData.slice ---
 
@@ -178,3 +319,25 @@ class TestMatrixSlice:
         sliced = mat.slice(mat.row_ids, mat.col_ids)
         np.testing.assert_array_equal(sliced.values, mat.values)
         assert sliced.shape == mat.shape
+
+    def test_slice_matches_fancy_indexing(self):
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame(
+            rng.normal(size=(6, 5)),
+            index=[f"r{i}" for i in range(6)],
+            columns=[f"c{j}" for j in range(5)],
+        )
+        mat = MatrixData(df)
+        # Contiguous runs, reversed and scattered orders on either axis
+        for rows in ([1, 2, 3], [3, 2, 1], [0, 4, 5]):
+            for cols in ([0, 1], [4, 2], [1, 2, 3, 4]):
+                sliced = mat.slice(mat.row_ids[rows], mat.col_ids[cols])
+                np.testing.assert_array_equal(
+                    sliced.values, df.values[np.ix_(rows, cols)]
+                )
+                assert sliced.values.flags.c_contiguous
+
+    def test_slice_unknown_id_raises(self, small_matrix_df):
+        mat = MatrixData(small_matrix_df)
+        with pytest.raises(KeyError):
+            mat.slice(np.array(["gene_A", "nope"]), mat.col_ids)